@@ -58,6 +58,23 @@ class CacheManager:
             f"CacheManager(namespace={self.namespace}, ttl={self.ttl_seconds}s, max_size={self.max_size_bytes}B)"
         )
 
+    @classmethod
+    def from_config(
+        cls,
+        directory_manager: "DirectoryManager",
+        config_manager: "ConfigManager",
+        namespace: str = "general",
+    ) -> Optional["CacheManager"]:
+        """Cria o cache do namespace, ou None se cache.enabled for falso ou o diretório falhar."""
+        cache_conf = config_manager.get("cache", {}) or {}
+        if not cache_conf.get("enabled", True):
+            return None
+        try:
+            return cls(directory_manager, config_manager, namespace=namespace)
+        except Exception as e:
+            logger.debug(f"Cache '{namespace}' indisponível: {e}")
+            return None
+
     # ----------------------- Helpers -----------------------
     def _normalize_namespace(self, ns: str) -> str:
         s = (ns or "general").strip().lower()
@@ -10,12 +10,29 @@ License: GPL-3.0
 """
 
 import os
+import json
+import hashlib
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from loguru import logger
 from copy import deepcopy
 
+try:
+    # Usa o libyaml (C) quando disponível; senão, a implementação em Python
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+
+def _has_only_str_keys(data: Any) -> bool:
+    """Indica se todos os dicts aninhados usam apenas chaves string (preservadas em JSON)."""
+    if isinstance(data, dict):
+        return all(isinstance(k, str) and _has_only_str_keys(v) for k, v in data.items())
+    if isinstance(data, list):
+        return all(_has_only_str_keys(v) for v in data)
+    return True
+
 
 class ConfigManager:
     """Gerenciador de configurações da aplicação."""
@@ -62,7 +79,8 @@ class ConfigManager:
         # --- NEW: search defaults ---
         'search': {
             'max_results': 100,
-            'results_per_page': 10
+            'results_per_page': 10,
+            'interactive': False
         },
         'performance': {
             'test_mirrors': True,
@@ -71,13 +89,16 @@ class ConfigManager:
         }
     }
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, cache_dir: Optional[Path] = None):
         """Inicializa o gerenciador de configurações.
         
         Args:
             config_path: Caminho para o arquivo de configuração personalizado.
+            cache_dir: Diretório de cache onde fica o sidecar JSON do config.yml.
+                Se None, o YAML é sempre lido diretamente.
         """
         self.config_path = Path(config_path) if config_path else self._get_default_config_path()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.config = deepcopy(self.DEFAULT_CONFIG)
         # Snapshot do estado carregado para detecção de mudanças
         self._loaded_snapshot: Dict[str, Any] = {}
@@ -101,11 +122,10 @@ class ConfigManager:
 
             # Carrega overrides de config.yml (se existir)
             if self.config_path.exists():
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    file_config = yaml.safe_load(f)
-                    if file_config:
-                        self._merge_config(self.config, file_config)
-                        logger.info(f"Configuração carregada: {self.config_path}")
+                file_config = self._read_config_file()
+                if file_config:
+                    self._merge_config(self.config, file_config)
+                    logger.info(f"Configuração carregada: {self.config_path}")
             else:
                 # Aviso quando arquivo não existir; seguir com defaults e env vars
                 logger.warning(f"Arquivo de configuração não encontrado em {self.config_path}. Usando valores padrão em memória.")
@@ -122,6 +142,45 @@ class ConfigManager:
             logger.error(f"Erro ao carregar configurações: {e}")
             return False
     
+    def _read_config_file(self) -> Optional[Dict[str, Any]]:
+        """Lê o config.yml, reaproveitando um sidecar JSON enquanto o YAML não muda.
+
+        O sidecar fica em cache_dir (um por caminho de config.yml) e guarda
+        mtime e tamanho do YAML de origem; se conferirem, evita o parse YAML,
+        bem mais lento que o JSON. Não é gravado quando o YAML tem chaves não
+        string, que o JSON converteria em texto.
+        """
+        if self.cache_dir is None:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                return yaml.load(f, Loader=SafeLoader)
+
+        stat = self.config_path.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        path_hash = hashlib.sha1(str(self.config_path.resolve()).encode('utf-8')).hexdigest()[:16]
+        cache_path = self.cache_dir / f"config_{path_hash}.json"
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('_yaml_stamp') == stamp:
+                return cached.get('data')
+        except (OSError, ValueError, AttributeError):
+            pass  # sem cache, corrompido ou em formato inesperado
+
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=SafeLoader)
+        if not _has_only_str_keys(data):
+            return data
+
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'_yaml_stamp': stamp, 'data': data}, f, ensure_ascii=False)
+            tmp_path.replace(cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Não foi possível gravar o cache da configuração: {e}")
+            tmp_path.unlink(missing_ok=True)
+        return data
+
     def _merge_config(self, base: Dict[str, Any], override: Dict[str, Any]):
         """Mescla configurações recursivamente.
         
@@ -265,7 +324,7 @@ class ConfigManager:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config, f, default_flow_style=False, 
+                yaml.dump(self.config, f, Dumper=SafeDumper, default_flow_style=False,
                          allow_unicode=True, indent=2)
             
             logger.info(f"Configurações salvas: {self.config_path}")
@@ -288,7 +347,7 @@ class ConfigManager:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self.DEFAULT_CONFIG, f, default_flow_style=False,
+                yaml.dump(self.DEFAULT_CONFIG, f, Dumper=SafeDumper, default_flow_style=False,
                          allow_unicode=True, indent=2)
             
             logger.info(f"Arquivo de configuração padrão criado: {self.config_path}")
@@ -12,13 +12,16 @@ License: GPL-3.0
 import time
 import requests
 import os
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 from urllib.parse import urljoin, urlparse, unquote
 from loguru import logger
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    from .cache_manager import CacheManager
 
-@dataclass
+
+@dataclass(slots=True)
 class ROMEntry:
     """Representa uma entrada de ROM da API."""
     slug: str
@@ -220,11 +223,16 @@ class SearchResult:
 class CrocDBClient:
     """Cliente para a API CrocDB."""
     
+    # Endpoints GET de conteúdo estável, guardados no cache com ETag/Last-Modified.
+    # /entry/random fica de fora: cada resposta deve ser diferente.
+    _CONDITIONAL_ENDPOINTS = frozenset({'/platforms', '/regions', '/info'})
+    
     def __init__(self, 
                  base_url: str = "https://api.crocdb.net",
                  timeout: int = 30,
                  max_retries: int = 3,
-                 retry_delay: float = 1.0):
+                 retry_delay: float = 1.0,
+                 cache: Optional["CacheManager"] = None):
         """Inicializa o cliente da API.
         
         Args:
@@ -232,6 +240,8 @@ class CrocDBClient:
             timeout: Timeout para requisições em segundos
             max_retries: Número máximo de tentativas
             retry_delay: Delay entre tentativas em segundos
+            cache: Cache em disco onde respostas GET são guardadas com seus
+                validadores (ETag/Last-Modified); sem ele não há requisições condicionais
         """
         self.base_url = (base_url or "https://api.crocdb.net").rstrip('/')
         self.timeout = timeout
@@ -245,6 +255,7 @@ class CrocDBClient:
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         })
+        self.cache = cache
         
         logger.debug(f"Cliente CrocDB inicializado: {self.base_url}")
     
@@ -266,6 +277,23 @@ class CrocDBClient:
         """
         url = urljoin(self.base_url + '/', endpoint.lstrip('/'))
         
+        # Requisição condicional: reenvia os validadores da última resposta GET
+        # (guardados no cache em disco junto do corpo) para que o servidor
+        # possa responder 304 sem corpo
+        cache_key = f"{url}?{sorted(params.items())}" if params else url
+        use_cache = (
+            self.cache is not None
+            and method.upper() == 'GET'
+            and '/' + endpoint.lstrip('/') in self._CONDITIONAL_ENDPOINTS
+        )
+        cached = self.cache.get_json(cache_key) if use_cache else None
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
         for attempt in range(self.max_retries + 1):
             try:
                 start_time = time.time()
@@ -273,7 +301,7 @@ class CrocDBClient:
                 logger.debug(f"Requisição {method} para {url} (tentativa {attempt + 1})")
                 
                 if method.upper() == 'GET':
-                    response = self.session.get(url, params=params, timeout=self.timeout)
+                    response = self.session.get(url, params=params, timeout=self.timeout, headers=headers or None)
                 elif method.upper() == 'POST':
                     response = self.session.post(url, json=data, params=params, timeout=self.timeout)
                 else:
@@ -282,10 +310,24 @@ class CrocDBClient:
                 response_time = time.time() - start_time
                 logger.debug(f"Resposta recebida: {response.status_code} em {response_time:.3f}s")
                 
+                # Conteúdo inalterado desde a última resposta: reutiliza os dados guardados
+                if response.status_code == 304 and cached:
+                    logger.debug(f"Conteúdo inalterado (304): {url}")
+                    return True, cached.get('data')
+                
                 # Verifica se a resposta foi bem-sucedida
                 if response.status_code == 200:
                     try:
                         json_data = response.json()
+                        if use_cache:
+                            etag = response.headers.get('ETag')
+                            last_modified = response.headers.get('Last-Modified')
+                            if etag or last_modified:
+                                self.cache.set_json(cache_key, {
+                                    'etag': etag,
+                                    'last_modified': last_modified,
+                                    'data': json_data,
+                                })
                         return True, json_data
                     except ValueError as e:
                         logger.error(f"Erro ao decodificar JSON: {e}")
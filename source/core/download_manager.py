@@ -18,6 +18,7 @@ import aiofiles
 import httpx
 from pathlib import Path
 from typing import Dict, List, Optional, Callable, Any, Tuple
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from urllib.parse import urlparse
 from loguru import logger
@@ -28,7 +29,7 @@ from ..core.directory_manager import DirectoryManager
 from ..core.helpers import sanitize_filename
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadProgress:
     """Representa o progresso de um download."""
     filename: str
@@ -186,12 +187,44 @@ class DownloadManager:
         self.mirror_tester = MirrorTester()
         self.preferred_hosts = []
         self.progress_callback = None
+        # Cliente HTTP compartilhado (pool de conexões), atrelado ao event loop que o criou
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Semáforo para controlar downloads simultâneos
         self.semaphore = asyncio.Semaphore(max_concurrent)
         
         logger.debug(f"Download Manager inicializado: {max_concurrent} downloads simultâneos")
     
+    @asynccontextmanager
+    async def _client_scope(self):
+        """Fornece o cliente HTTP para um download no event loop atual.
+
+        O primeiro loop a pedir um cliente passa a ser o dono do cliente
+        compartilhado: downloads seguidos nele aproveitam conexões TCP/TLS já
+        abertas. Qualquer outro loop (ex.: outra thread) recebe um cliente
+        próprio, fechado ao fim do download, sem nunca substituir o compartilhado.
+        """
+        loop = asyncio.get_running_loop()
+        owner = self._client_loop
+        if self._client is None or self._client.is_closed or owner is None or owner.is_closed():
+            self._client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
+            self._client_loop = owner = loop
+        if owner is loop:
+            yield self._client
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+                yield client
+
+    async def aclose(self) -> None:
+        """Fecha o cliente HTTP compartilhado, se pertencer ao event loop atual."""
+        if self._client_loop is not asyncio.get_running_loop():
+            return
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+    
     def set_progress_callback(self, callback: Callable[[DownloadProgress], None]):
         """Define callback para atualizações de progresso.
         
@@ -354,45 +387,44 @@ class DownloadManager:
                                expected_size: Optional[int] = None) -> bool:
         """Executa o download do arquivo."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                async with client.stream('GET', url) as response:
-                    if response.status_code != 200:
-                        logger.error(f"Erro HTTP {response.status_code} para {url}")
-                        return False
-                    
-                    total_size = expected_size
-                    if not total_size:
-                        content_length = response.headers.get('content-length')
-                        if content_length:
-                            total_size = int(content_length)
-                    
-                    downloaded = 0
-                    start_time = time.time()
-                    
-                    async with aiofiles.open(temp_path, 'wb') as f:
-                        async for chunk in response.aiter_bytes(self.chunk_size):
-                            await f.write(chunk)
-                            downloaded += len(chunk)
+            async with self._client_scope() as client, client.stream('GET', url) as response:
+                if response.status_code != 200:
+                    logger.error(f"Erro HTTP {response.status_code} para {url}")
+                    return False
+                
+                total_size = expected_size
+                if not total_size:
+                    content_length = response.headers.get('content-length')
+                    if content_length:
+                        total_size = int(content_length)
+                
+                downloaded = 0
+                start_time = time.time()
+                
+                async with aiofiles.open(temp_path, 'wb') as f:
+                    async for chunk in response.aiter_bytes(self.chunk_size):
+                        await f.write(chunk)
+                        downloaded += len(chunk)
+                        
+                        # Atualiza progresso
+                        if self.progress_callback and total_size:
+                            elapsed = time.time() - start_time
+                            speed = downloaded / elapsed if elapsed > 0 else 0
+                            eta = (total_size - downloaded) / speed if speed > 0 else 0
                             
-                            # Atualiza progresso
-                            if self.progress_callback and total_size:
-                                elapsed = time.time() - start_time
-                                speed = downloaded / elapsed if elapsed > 0 else 0
-                                eta = (total_size - downloaded) / speed if speed > 0 else 0
-                                
-                                progress = DownloadProgress(
-                                    filename=filename,
-                                    total_size=total_size,
-                                    downloaded=downloaded,
-                                    speed=speed,
-                                    eta=eta,
-                                    percentage=(downloaded / total_size) * 100,
-                                    status='downloading'
-                                )
-                                self.progress_callback(progress)
-                    
-                    return True
-                    
+                            progress = DownloadProgress(
+                                filename=filename,
+                                total_size=total_size,
+                                downloaded=downloaded,
+                                speed=speed,
+                                eta=eta,
+                                percentage=(downloaded / total_size) * 100,
+                                status='downloading'
+                            )
+                            self.progress_callback(progress)
+                
+                return True
+                
         except Exception as e:
             logger.error(f"Erro durante download: {e}")
             return False
@@ -14,6 +14,7 @@ import time
 import hashlib
 import platform
 import difflib
+import functools
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 from urllib.parse import urlparse
@@ -48,6 +49,11 @@ def format_file_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} {size_names[i]}"
 
 
+# Variante memoizada para listagens de ROMs, onde o mesmo tamanho se repete entre
+# linhas (mesmo dump em várias regiões). O progresso de download usa a função
+# simples: seus valores mudam a cada chunk e só ocupariam o cache.
+format_file_size_cached = functools.lru_cache(maxsize=1024)(format_file_size)
+
 
 def format_duration(seconds: float) -> str:
     """Formata duração em formato legível.
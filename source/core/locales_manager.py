@@ -15,6 +15,8 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from loguru import logger
 
+from .config_manager import SafeLoader
+
 
 class I18nManager:
     """Gerenciador de internacionalização.
@@ -112,7 +114,7 @@ class I18nManager:
                 return False
             
             with open(language_file, 'r', encoding='utf-8') as f:
-                translations = yaml.safe_load(f) or {}
+                translations = yaml.load(f, Loader=SafeLoader) or {}
             
             if is_fallback:
                 self.fallback_translations = translations
@@ -178,9 +180,8 @@ class I18nManager:
         
         if language_file.exists():
             try:
-                import yaml
                 with open(language_file, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=SafeLoader)
                     
                 # Tenta obter o nome do idioma do arquivo
                 if isinstance(data, dict):
@@ -22,22 +22,32 @@ from ..core.helpers import (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SearchFilter:
-    """Filtros para busca de ROMs."""
-    platforms: Optional[List[str]] = None
-    regions: Optional[List[str]] = None
+    """Filtros para busca de ROMs.
+
+    Imutável e hashável: serve de chave de cache entre páginas da mesma busca.
+    Listas recebidas são convertidas em tuplas.
+    """
+    platforms: Optional[Tuple[str, ...]] = None
+    regions: Optional[Tuple[str, ...]] = None
     year_min: Optional[int] = None
     year_max: Optional[int] = None
     min_size: Optional[int] = None
     max_size: Optional[int] = None
-    languages: Optional[List[str]] = None
+    languages: Optional[Tuple[str, ...]] = None
     exclude_hacks: bool = False
     exclude_homebrew: bool = False
     exclude_prototypes: bool = False
 
+    def __post_init__(self):
+        for name in ('platforms', 'regions', 'languages'):
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+
 
-@dataclass
+@dataclass(slots=True)
 class ROMScore:
     """Pontuação de relevância de uma ROM."""
     rom_entry: ROMEntry
@@ -74,6 +84,8 @@ class SearchEngine:
         page_count: int
         has_prev: bool
         has_next: bool
+        # Consulta à API falhou: lista vazia não significa "sem resultados"
+        failed: bool = False
 
     def __init__(self, api_client: CrocDBClient):
         """Inicializa o motor de busca.
@@ -84,6 +96,9 @@ class SearchEngine:
         self.api_client = api_client
         self.platforms_cache = None
         self.regions_cache = None
+        # Último ranking completo de search_paged: (chave da busca, lista classificada).
+        # As demais páginas da mesma busca são fatiadas daqui, sem nova consulta à API.
+        self._ranked_cache = None
         
         logger.debug("Search Engine inicializado")
     
@@ -533,8 +548,15 @@ class SearchEngine:
             limit: Número máximo de resultados
             
         Returns:
-            Lista de ROMs ordenadas por relevância
+            Lista de ROMs ordenadas por relevância (vazia também em caso de falha)
         """
+        return await self._search_ranked(query, search_filter, limit) or []
+
+    async def _search_ranked(self,
+                             query: str,
+                             search_filter: Optional[SearchFilter] = None,
+                             limit: int = 50) -> Optional[List[ROMScore]]:
+        """Implementação de search(): retorna None quando a consulta à API falha."""
         if not query.strip():
             logger.warning("Consulta de busca vazia")
             return []
@@ -553,7 +575,10 @@ class SearchEngine:
                 max_results=max(200, limit * 4)  # Busca mais para ter margem após filtros
             )
             
-            if not search_result or not search_result.results:
+            if search_result is None:
+                logger.error("Falha ao consultar a API de busca")
+                return None
+            if not search_result.results:
                 logger.info("Nenhum resultado encontrado")
                 return []
             
@@ -698,7 +723,7 @@ class SearchEngine:
             return scored_roms[:limit]
         except Exception as e:
             logger.error(f"Erro na busca: {e}")
-            return []
+            return None
 
     async def search_paged(self,
                            query: str,
@@ -718,7 +743,21 @@ class SearchEngine:
         if search_filter is None:
             search_filter = SearchFilter()
         try:
-            scored_roms = await self.search(query, search_filter, limit=max_results)
+            key = (query, search_filter, max_results)
+            # A página 1 sempre consulta a API (uma nova busca não reusa um ranking
+            # antigo); as seguintes da mesma busca são fatiadas do ranking guardado
+            if page > 1 and self._ranked_cache is not None and self._ranked_cache[0] == key:
+                scored_roms = self._ranked_cache[1]
+            else:
+                scored_roms = await self._search_ranked(query, search_filter, limit=max_results)
+                if scored_roms is None:
+                    self._ranked_cache = None
+                    return SearchEngine.PagedSearchResult(
+                        items=[], total=0, page=page, per_page=per_page,
+                        page_count=0, has_prev=False, has_next=False, failed=True
+                    )
+                # Lista vazia não é fixada no cache (evita reter buscas sem resultado)
+                self._ranked_cache = (key, scored_roms) if scored_roms else None
             total = len(scored_roms)
 
             # Calcula fatia da página
@@ -745,7 +784,7 @@ class SearchEngine:
             logger.error(f"Erro na busca paginada: {e}")
             return SearchEngine.PagedSearchResult(
                 items=[], total=0, page=page, per_page=per_page,
-                page_count=0, has_prev=False, has_next=False
+                page_count=0, has_prev=False, has_next=False, failed=True
             )
 
     def search_paged_sync(self,
@@ -767,7 +806,7 @@ class SearchEngine:
         except Exception as e:
             logger.error(f"Erro na busca paginada síncrona: {e}")
             return SearchEngine.PagedSearchResult(items=[], total=0, page=page, per_page=per_page,
-                                                  page_count=0, has_prev=False, has_next=False)
+                                                  page_count=0, has_prev=False, has_next=False, failed=True)
 
     async def search_random(self, 
                            search_filter: Optional[SearchFilter] = None,
@@ -18,9 +18,8 @@ __license__ = "GPL-3.0"
 
 from importlib.util import find_spec
 
-# Import core, always lightweight
+# Import core, always lightweight (CLI defers its API/download stack to first use)
 from .cli import CLIInterface
-from .shell import ShellInterface
 
 # Export only always-available interfaces explicitly
 __all__ = [
@@ -28,6 +27,15 @@ __all__ = [
     'ShellInterface',
 ]
 
+
+def __getattr__(name: str):
+    """Lazily import ShellInterface, which pulls in the HTTP client at import time."""
+    if name == 'ShellInterface':
+        from .shell import ShellInterface
+        return ShellInterface
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Interface availability check functions (without importing heavy modules)
 
 def is_tui_available() -> bool:
@@ -63,6 +71,8 @@ def get_available_interfaces() -> dict:
     Get a dictionary of available interfaces mapped to their classes.
     Will lazily import TUI/GUI only if available and requested by this call.
     """
+    from .shell import ShellInterface
+
     interfaces = {
         'cli': CLIInterface,
         'shell': ShellInterface,
@@ -95,6 +105,7 @@ def create_interface(interface_name: str, config_manager, directory_manager, log
     if name == 'cli':
         return CLIInterface(config_manager, directory_manager, log_manager)
     if name == 'shell':
+        from .shell import ShellInterface
         return ShellInterface(config_manager, directory_manager, log_manager)
     if name == 'tui':
         if not is_tui_available():
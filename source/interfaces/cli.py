@@ -8,41 +8,379 @@ Interface de linha de comando para busca e download de ROMs.
 Author: Leonne Martins (@Oraculo-sh)
 License: GPL-3.0
 """
+from __future__ import annotations
 
 import argparse
+import asyncio
+import collections
+import csv
+import dataclasses
+import errno
+import functools
 import json
+import operator
 import os
+import re
+import shutil
 import sys
-import yaml
-from typing import List, Optional
+import time
+from typing import List, Optional, TYPE_CHECKING
 from loguru import logger
 
-from ..core.search_engine import SearchEngine, SearchFilter
-from ..core.config_manager import ConfigManager
-from ..core.crocdb_client import CrocDBClient
-from ..core.helpers import format_file_size
-from ..core import DownloadManager, DownloadProgress
+try:
+    # Habilita edição de linha e histórico em input() quando disponível (POSIX)
+    import readline  # noqa: F401
+except ImportError:
+    readline = None
+
+# Tenta importar orjson (serialização JSON em Rust); se indisponível, usa o json da stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..core.config_manager import ConfigManager, SafeDumper
+from ..core.cache_manager import CacheManager
+from ..core.helpers import format_file_size, format_file_size_cached
+
+# Motor de busca, cliente HTTP e gerenciador de downloads puxam requests/httpx;
+# são importados sob demanda para que `--help` e erros de argumentos saiam rápido
+if TYPE_CHECKING:
+    from ..core.search_engine import SearchEngine, ROMScore
+    from ..core.crocdb_client import CrocDBClient
+    from ..core.download_manager import DownloadManager, DownloadProgress
+
+
+# Campos lidos por linha na exibição de resultados (ROMScore -> ROMEntry),
+# obtidos de uma vez por um getter em C
+_ROW_FIELDS = operator.attrgetter(
+    'rom_entry.slug', 'rom_entry.rom_id', 'rom_entry.title', 'rom_entry.platform',
+    'rom_entry.regions', 'rom_entry.year', 'rom_entry.hosts', 'rom_entry.file_format',
+    'rom_entry.size', 'total_score',
+)
+
+# Comandos de navegação do prompt de seleção e validação da lista de índices
+_NAV_KEYS = frozenset({'n', 'p', 'q', '0'})
+_INDEX_RE = re.compile(r'^\s*\d+(?:\s*,\s*\d+)*\s*$')
+_DIGITS_RE = re.compile(r'\d+')
+
+# Conversão de valores de `config --set`: literais e números reconhecidos sem try/except
+_CONFIG_LITERALS = {'true': True, 'false': False, 'null': None, 'none': None}
+# Dígitos com "_" simples entre eles, como aceitam int()/float() (ex.: 1_000)
+_DIGIT_GROUP = r'\d(?:_?\d)*'
+_INT_VALUE_RE = re.compile(rf'[+-]?{_DIGIT_GROUP}')
+_FLOAT_VALUE_RE = re.compile(
+    rf'[+-]?(?:{_DIGIT_GROUP}\.(?:{_DIGIT_GROUP})?|\.{_DIGIT_GROUP})(?:[eE][+-]?{_DIGIT_GROUP})?'
+)
+
+# Chave do cache em disco que guarda os resultados da última busca,
+# usados por `download <índice>` / `boxart <índice>` em outra invocação
+_LAST_RESULTS_KEY = "last_results"
+
+# Tabela de resultados: larguras das colunas, cabeçalho e template de linha
+# montados uma única vez no import, não a cada página exibida
+_W_IDX, _W_TITLE, _W_ID, _W_PLATFORM, _W_REGIONS, _W_HOSTS, _W_FORMAT, _W_SIZE, _W_SCORE = (
+    3, 38, 10, 9, 4, 12, 7, 9, 6
+)
+_TABLE_HEADER = " ".join((
+    "#".rjust(_W_IDX),
+    "Título".ljust(_W_TITLE),
+    "ID".ljust(_W_ID),
+    "Platform".ljust(_W_PLATFORM),
+    "Reg.".ljust(_W_REGIONS),
+    "Hosts".ljust(_W_HOSTS),
+    "Format".ljust(_W_FORMAT),
+    "Size".rjust(_W_SIZE),
+    "Score",
+))
+_TABLE_SEP = " ".join(
+    "-" * w for w in (_W_IDX, _W_TITLE, _W_ID, _W_PLATFORM, _W_REGIONS, _W_HOSTS, _W_FORMAT, _W_SIZE, 5)
+)
+# A precisão (".N") trunca e a largura preenche numa só chamada de format
+_TABLE_ROW_FMT = (
+    f"{{:>{_W_IDX}}} {{:<{_W_TITLE}.{_W_TITLE}}} {{:<{_W_ID}.{_W_ID}}} {{:<{_W_PLATFORM}.{_W_PLATFORM}}} "
+    f"{{:<{_W_REGIONS}.{_W_REGIONS}}} {{:<{_W_HOSTS}.{_W_HOSTS}}} {{:<{_W_FORMAT}.{_W_FORMAT}}} "
+    f"{{:>{_W_SIZE}.{_W_SIZE}}} {{:>{_W_SCORE}.3f}}"
+).format
+
+# Linhas de progresso de download (arquivo único e lote)
+_PROGRESS_PCT_FMT = "Baixando: {:.1f}% ({})".format
+_PROGRESS_NO_PCT_FMT = "Baixando... ({})".format
+_BATCH_PROGRESS_FMT = "Baixando: {:.1f}% ({}/{} concluídos)".format
+
+
+def _score_from_dict(data: dict) -> ROMScore:
+    """Reconstrói um ROMScore serializado com dataclasses.asdict."""
+    from ..core.search_engine import ROMScore
+    from ..core.crocdb_client import ROMEntry
+
+    data = dict(data)
+    entry = ROMEntry(**data.pop('rom_entry'))
+    return ROMScore(rom_entry=entry, **data)
+
+
+def _score_to_record(s: ROMScore, index: int) -> dict:
+    """Registro de um resultado de busca para a saída JSON."""
+    slug, _romid, title, platform, regions, year, hosts, fmt, size, score = _ROW_FIELDS(s)
+    return {
+        "index": index,
+        "slug": slug,
+        "title": title,
+        "platform": platform,
+        "regions": regions,
+        "year": year,
+        "hosts": hosts,
+        "format": fmt,
+        "size": size,
+        "score": round(score, 3),
+    }
+
+
+def _score_to_csv_row(s: ROMScore, index: int) -> tuple:
+    """Linha de um resultado de busca para a saída CSV."""
+    slug, _romid, title, platform, regions, _year, hosts, fmt, size, score = _ROW_FIELDS(s)
+    return (
+        index, slug, title, platform, ",".join(regions or ()), hosts or "", fmt or "",
+        size if size is not None else "", f"{score:.3f}",
+    )
+
+
+def _json_dumps(obj, indent: bool = False) -> str:
+    """Serializa para JSON (UTF-8 sem escapes), com orjson quando disponível."""
+    if orjson is not None:
+        try:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            pass  # tipo não suportado pelo orjson: usa a stdlib
+    # Mesmos separadores do orjson: saída idêntica com ou sem ele
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _silence_broken_pipe():
+    """Redireciona o stdout para devnull após o consumidor fechar o pipe (ex.: `| head`).
+
+    Evita um segundo BrokenPipeError quando o interpretador tentar dar flush na saída.
+    """
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+    except (OSError, ValueError):
+        pass
+
+
+def _add_search_parser(subparsers) -> None:
+    """Subcomando `search`."""
+    search_parser = subparsers.add_parser(
+        "search", help="Buscar ROMs por palavras-chave e filtros"
+    )
+    search_parser.add_argument(
+        "query",
+        nargs='+',
+        help="Palavras-chave da busca (use múltiplas para correspondência AND)"
+    )
+    search_parser.add_argument(
+        "--platform", "-p", nargs="*", help="Filtrar por plataforma(s)"
+    )
+    search_parser.add_argument(
+        "--region", "-r", nargs="*", help="Filtrar por região(ões)"
+    )
+    search_parser.add_argument(
+        "--year", "-y", type=int, help="Ano alvo (aproximação)"
+    )
+    # novo: alinhado ao model.md
+    search_parser.add_argument(
+        "--max-results", "-m", type=int, default=None, help="Máximo de resultados por página (padrão 100, máximo 100)"
+    )
+    search_parser.add_argument(
+        "--page", type=int, default=None, help="Número da página inicial (padrão: 1)"
+    )
+    # legado: mantido por compatibilidade
+    search_parser.add_argument(
+        "--limit", "-l", type=int, default=None, help="Limite total de resultados (sobrepõe config)"
+    )
+    search_parser.add_argument(
+        "--per-page", "-pp", type=int, default=None, help="Resultados por página (sobrepõe config)"
+    )
+    search_parser.add_argument(
+        "--format", "-f", choices=["table", "json", "csv"], default="table",
+        help="Formato de saída"
+    )
+    search_parser.add_argument(
+        "--no-cache", action="store_true", help="Ignora o cache em disco e consulta a API"
+    )
+
+
+def _add_info_parser(subparsers) -> None:
+    """Subcomando `info`."""
+    info_parser = subparsers.add_parser("info", help="Mostrar informações detalhadas de uma ROM")
+    info_parser.add_argument("rom_id", help="Slug/ID da ROM")
+    info_parser.add_argument(
+        "--format", "-f", choices=["table", "json"], default="table", help="Formato de saída"
+    )
+
+
+def _add_download_parser(subparsers) -> None:
+    """Subcomando `download`."""
+    dl_parser = subparsers.add_parser("download", help="Baixar ROM por ID ou por posição nos resultados")
+    dl_parser.add_argument("target", nargs='?', default=None, help="Slug/ID ou índice do resultado (ex.: 1, 15)")
+    dl_parser.add_argument("--romid", help="ROM ID específico", default=None)
+    dl_parser.add_argument("--slug", help="Slug específico", default=None)
+    dl_parser.add_argument("--platform", "-p", nargs="*", help="Filtrar por plataforma(s)", default=None)
+    dl_parser.add_argument("--region", "-r", nargs="*", help="Filtrar por região(ões)", default=None)
+    dl_parser.add_argument("--no-boxart", action="store_true", help="Baixa sem boxart")
+    dl_parser.add_argument("--force", "-f", action="store_true", help="Baixa sem confirmação")
+    dl_parser.add_argument("--silence", "-s", action="store_true", help="Baixa silenciosamente")
+    dl_parser.add_argument("--output", "-o", default=".", help="Diretório de saída")
+
+
+def _add_boxart_parser(subparsers) -> None:
+    """Subcomando `boxart`."""
+    box_parser = subparsers.add_parser("boxart", help="Baixar somente a boxart da ROM")
+    box_parser.add_argument("target", nargs='?', default=None, help="Slug/ID ou índice do resultado (ex.: 1, 15)")
+    box_parser.add_argument("--romid", help="ROM ID específico", default=None)
+    box_parser.add_argument("--slug", help="Slug específico", default=None)
+    box_parser.add_argument("--platform", "-p", nargs="*", help="Filtrar por plataforma(s)", default=None)
+    box_parser.add_argument("--region", "-r", nargs="*", help="Filtrar por região(ões)", default=None)
+    box_parser.add_argument("--force", "-f", action="store_true", help="Baixa sem confirmação")
+    box_parser.add_argument("--silence", "-s", action="store_true", help="Baixa silenciosamente")
+
+
+def _add_random_parser(subparsers) -> None:
+    """Subcomando `random`."""
+    rnd_parser = subparsers.add_parser("random", help="Obter ROM(s) aleatória(s)")
+    rnd_parser.add_argument("--count", "-n", type=int, default=1, help="Quantidade de ROMs (padrão: 1)")
+    rnd_parser.add_argument("--platform", "-p", nargs="*", help="Filtrar por plataforma(s)", default=None)
+    rnd_parser.add_argument("--region", "-r", nargs="*", help="Filtrar por região(ões)", default=None)
+
+
+def _add_platforms_parser(subparsers) -> None:
+    """Subcomando `platforms`."""
+    subparsers.add_parser("platforms", help="Listar plataformas disponíveis")
+
+
+def _add_regions_parser(subparsers) -> None:
+    """Subcomando `regions`."""
+    subparsers.add_parser("regions", help="Listar regiões disponíveis")
+
+
+def _add_config_parser(subparsers) -> None:
+    """Subcomando `config`."""
+    cfg_parser = subparsers.add_parser("config", help="Gerenciar configurações")
+    cfg_group = cfg_parser.add_mutually_exclusive_group(required=True)
+    cfg_group.add_argument("--list", action="store_true", help="Listar todas as configurações")
+    cfg_group.add_argument("--get", metavar="KEY", help="Obter valor (formato section.key)")
+    cfg_group.add_argument("--set", nargs=2, metavar=("KEY", "VALUE"), help="Definir valor (formato section.key VALUE)")
+    cfg_group.add_argument("--save", action="store_true", help="Salvar configurações em arquivo")
+    cfg_group.add_argument("--reset", action="store_true", help="Resetar arquivo de configuração para o padrão")
+    cfg_parser.add_argument("--format", choices=["json", "yaml"], default="json", help="Formato de exibição para --list")
+
+
+# Fábricas dos subcomandos, na ordem exibida em `--help`
+_SUBCOMMANDS = {
+    "search": _add_search_parser,
+    "info": _add_info_parser,
+    "download": _add_download_parser,
+    "boxart": _add_boxart_parser,
+    "random": _add_random_parser,
+    "platforms": _add_platforms_parser,
+    "regions": _add_regions_parser,
+    "config": _add_config_parser,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Constrói o parser do CLI uma única vez por processo (e por subcomando).
+
+    Com `command` conhecido, só o subparser desse comando é montado; os demais
+    não são usados no parse. Sem comando (ou com `-h`/comando inválido), monta
+    todos para que a ajuda e as mensagens de erro do argparse fiquem completas.
+    O parser só guarda a definição dos argumentos, então pode ser
+    compartilhado entre instâncias de CLIInterface.
+    """
+    parser = argparse.ArgumentParser(
+        prog="clidownrom",
+        description="Busque e baixe ROMs da CrocDB diretamente no terminal.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    if command in _SUBCOMMANDS:
+        _SUBCOMMANDS[command](subparsers)
+    else:
+        for add_parser in _SUBCOMMANDS.values():
+            add_parser(subparsers)
+    return parser
 
 
 class CLIInterface:
     """Interface de linha de comando com comandos estruturados."""
 
+    # Esquema fixo da saída JSON de `info` (campos de ROMEntry + derivados úteis)
+    _ROM_JSON_FIELDS = (
+        "slug", "rom_id", "title", "platform", "boxart_url", "regions", "links",
+        "year", "description", "size", "file_format", "hosts",
+    )
+
+    # Máximo de chaves (slug/rom_id) no cache de ROMs resolvidas da sessão
+    _INFO_CACHE_SIZE = 256
+
     def __init__(self, config_manager: ConfigManager, directory_manager, log_manager):
         self.config_manager = config_manager
         self.dirs = directory_manager
         self.logger = log_manager
-        # Inicializa API client conforme configuração
+        # API client, SearchEngine e DownloadManager são criados no primeiro uso
+        # Cache de ROMScore por índice global (0-based) para numeração contínua e downloads
+        self.cached_results = {}
+        self.cached_query = ""
+        self.cached_filter = None
+        self.cached_total = 0
+        # ROMs já resolvidas nesta sessão, por slug e por rom_id (info/download/boxart),
+        # em ordem de uso recente e limitadas a _INFO_CACHE_SIZE chaves
+        self._info_cache = collections.OrderedDict()
+        # Estado do throttle do callback de progresso, por arquivo:
+        # filename -> (último instante, último percentual, último status)
+        self._progress_state = {}
+        # Progresso agregado de um lote (_download_many):
+        # filename -> (baixado, total, status), tamanho do lote e última escrita
+        self._batch_files = {}
+        self._batch_size = 0
+        self._batch_ts = 0.0
+        # Progresso em terminal reescreve a linha com \r; em pipe/arquivo vira uma
+        # linha por atualização, sem flush forçado (buffer em blocos do stdout)
+        self._stdout_isatty = sys.stdout.isatty()
+        # Event loop reutilizado entre comandos (criado sob demanda)
+        self._loop = None
+
+    @functools.cached_property
+    def api_client(self) -> CrocDBClient:
+        """Cliente da API CrocDB conforme a seção 'api' da configuração."""
+        from ..core.crocdb_client import CrocDBClient
+
         api_config = self.config_manager.get('api', {}) or {}
-        self.api_client = CrocDBClient(
+        return CrocDBClient(
             base_url=api_config.get('base_url'),
             timeout=api_config.get('timeout', 30),
             max_retries=api_config.get('max_retries', 3),
-            retry_delay=api_config.get('retry_delay', 1)
+            retry_delay=api_config.get('retry_delay', 1),
+            cache=CacheManager.from_config(self.dirs, self.config_manager, namespace="api"),
         )
-        self.search_engine = SearchEngine(self.api_client)
-        # Inicializa DownloadManager conforme configuração
+
+    @functools.cached_property
+    def search_engine(self) -> SearchEngine:
+        from ..core.search_engine import SearchEngine
+
+        return SearchEngine(self.api_client)
+
+    @functools.cached_property
+    def download_manager(self) -> DownloadManager:
+        """DownloadManager conforme a seção 'download' da configuração."""
+        from ..core.download_manager import DownloadManager
+
+        api_config = self.config_manager.get('api', {}) or {}
         dl_conf = self.config_manager.get('download', {}) or {}
-        self.download_manager = DownloadManager(
+        manager = DownloadManager(
             self.dirs,
             max_concurrent=dl_conf.get('max_concurrent', 4),
             chunk_size=dl_conf.get('chunk_size', 8192),
@@ -52,112 +390,103 @@ class CLIInterface:
         )
         pref_hosts = dl_conf.get('preferred_hosts', []) or []
         if pref_hosts:
-            self.download_manager.set_preferred_hosts(pref_hosts)
-        self.cached_results = []  # Cache de ROMScore para numeração contínua e downloads
-        self.cached_query = ""
-        self.cached_filter = None
-        self.cached_total = 0
-        self.parser = self._create_parser()
-
-    def _create_parser(self):
-        parser = argparse.ArgumentParser(
-            prog="clidownrom",
-            description="Busque e baixe ROMs da CrocDB diretamente no terminal.",
-        )
-        subparsers = parser.add_subparsers(dest="command", required=True)
-
-        # search
-        search_parser = subparsers.add_parser(
-            "search", help="Buscar ROMs por palavras-chave e filtros"
-        )
-        search_parser.add_argument(
-            "query",
-            nargs='+',
-            help="Palavras-chave da busca (use múltiplas para correspondência AND)"
-        )
-        search_parser.add_argument(
-            "--platform", "-p", nargs="*", help="Filtrar por plataforma(s)"
-        )
-        search_parser.add_argument(
-            "--region", "-r", nargs="*", help="Filtrar por região(ões)"
-        )
-        search_parser.add_argument(
-            "--year", "-y", type=int, help="Ano alvo (aproximação)"
-        )
-        # novo: alinhado ao model.md
-        search_parser.add_argument(
-            "--max-results", "-m", type=int, default=None, help="Máximo de resultados por página (padrão 100, máximo 100)"
-        )
-        search_parser.add_argument(
-            "--page", type=int, default=None, help="Número da página inicial (padrão: 1)"
-        )
-        # legado: mantido por compatibilidade
-        search_parser.add_argument(
-            "--limit", "-l", type=int, default=None, help="Limite total de resultados (sobrepõe config)"
-        )
-        search_parser.add_argument(
-            "--per-page", "-pp", type=int, default=None, help="Resultados por página (sobrepõe config)"
-        )
-        search_parser.add_argument(
-            "--format", "-f", choices=["table", "json", "csv"], default="table",
-            help="Formato de saída"
-        )
-
-        # info
-        info_parser = subparsers.add_parser("info", help="Mostrar informações detalhadas de uma ROM")
-        info_parser.add_argument("rom_id", help="Slug/ID da ROM")
-        info_parser.add_argument(
-            "--format", "-f", choices=["table", "json"], default="table", help="Formato de saída"
-        )
+            manager.set_preferred_hosts(pref_hosts)
+        return manager
+
+    @functools.cached_property
+    def search_cache(self) -> Optional[CacheManager]:
+        """Cache em disco das buscas (namespace 'search'), ou None se desabilitado."""
+        return CacheManager.from_config(self.dirs, self.config_manager, namespace="search")
+
+    def _search_page(self, query, search_filter, page, per_page, max_results, use_cache=True):
+        """Obtém uma página de busca, servindo do cache em disco quando possível.
+
+        A chave considera consulta, filtros e paginação; o TTL segue cache.ttl_hours
+        e conta a partir de cached_at gravado na entrada (o mtime do arquivo é
+        renovado a cada leitura e não serve como idade).
+        Resultados vazios não são gravados (podem indicar falha na API).
+        """
+        from ..core.search_engine import SearchEngine
+
+        cache = self.search_cache if use_cache else None
+        key = repr((query, search_filter, page, per_page, max_results))
+        if cache is not None:
+            data = cache.get_json(key)
+            if data is not None:
+                try:
+                    age = time.time() - data['cached_at']
+                    if cache.ttl_seconds <= 0 or age <= cache.ttl_seconds:
+                        page_data = data['page']
+                        page_data['items'] = [_score_from_dict(item) for item in page_data['items']]
+                        return SearchEngine.PagedSearchResult(**page_data)
+                except (KeyError, TypeError) as e:
+                    logger.debug(f"Entrada de cache de busca inválida: {e}")
+
+        paged = self._run_async(self.search_engine.search_paged(
+            query=query,
+            search_filter=search_filter,
+            page=page,
+            per_page=per_page,
+            max_results=max_results,
+        ))
+        if cache is not None and paged.items:
+            cache.set_json(key, {'cached_at': time.time(), 'page': dataclasses.asdict(paged)})
+        return paged
+
+    def _save_last_results(self):
+        """Grava os resultados da busca atual para uso por índice em outra invocação."""
+        if self.search_cache is not None:
+            self.search_cache.set_json(
+                _LAST_RESULTS_KEY,
+                {idx: dataclasses.asdict(item) for idx, item in self.cached_results.items()},
+            )
 
-        # download
-        dl_parser = subparsers.add_parser("download", help="Baixar ROM por ID ou por posição nos resultados")
-        dl_parser.add_argument("target", nargs='?', default=None, help="Slug/ID ou índice do resultado (ex.: 1, 15)")
-        dl_parser.add_argument("--romid", help="ROM ID específico", default=None)
-        dl_parser.add_argument("--slug", help="Slug específico", default=None)
-        dl_parser.add_argument("--platform", "-p", nargs="*", help="Filtrar por plataforma(s)", default=None)
-        dl_parser.add_argument("--region", "-r", nargs="*", help="Filtrar por região(ões)", default=None)
-        dl_parser.add_argument("--no-boxart", action="store_true", help="Baixa sem boxart")
-        dl_parser.add_argument("--force", "-f", action="store_true", help="Baixa sem confirmação")
-        dl_parser.add_argument("--silence", "-s", action="store_true", help="Baixa silenciosamente")
-        dl_parser.add_argument("--output", "-o", default=".", help="Diretório de saída")
-
-        # boxart
-        box_parser = subparsers.add_parser("boxart", help="Baixar somente a boxart da ROM")
-        box_parser.add_argument("target", nargs='?', default=None, help="Slug/ID ou índice do resultado (ex.: 1, 15)")
-        box_parser.add_argument("--romid", help="ROM ID específico", default=None)
-        box_parser.add_argument("--slug", help="Slug específico", default=None)
-        box_parser.add_argument("--platform", "-p", nargs="*", help="Filtrar por plataforma(s)", default=None)
-        box_parser.add_argument("--region", "-r", nargs="*", help="Filtrar por região(ões)", default=None)
-        box_parser.add_argument("--force", "-f", action="store_true", help="Baixa sem confirmação")
-        box_parser.add_argument("--silence", "-s", action="store_true", help="Baixa silenciosamente")
-
-        # random
-        rnd_parser = subparsers.add_parser("random", help="Obter ROM(s) aleatória(s)")
-        rnd_parser.add_argument("--count", "-n", type=int, default=1, help="Quantidade de ROMs (padrão: 1)")
-        rnd_parser.add_argument("--platform", "-p", nargs="*", help="Filtrar por plataforma(s)", default=None)
-        rnd_parser.add_argument("--region", "-r", nargs="*", help="Filtrar por região(ões)", default=None)
-
-        # platforms
-        subparsers.add_parser("platforms", help="Listar plataformas disponíveis")
-        # regions
-        subparsers.add_parser("regions", help="Listar regiões disponíveis")
-
-        # config
-        cfg_parser = subparsers.add_parser("config", help="Gerenciar configurações")
-        cfg_group = cfg_parser.add_mutually_exclusive_group(required=True)
-        cfg_group.add_argument("--list", action="store_true", help="Listar todas as configurações")
-        cfg_group.add_argument("--get", metavar="KEY", help="Obter valor (formato section.key)")
-        cfg_group.add_argument("--set", nargs=2, metavar=("KEY", "VALUE"), help="Definir valor (formato section.key VALUE)")
-        cfg_group.add_argument("--save", action="store_true", help="Salvar configurações em arquivo")
-        cfg_group.add_argument("--reset", action="store_true", help="Resetar arquivo de configuração para o padrão")
-        cfg_parser.add_argument("--format", choices=["json", "yaml"], default="json", help="Formato de exibição para --list")
-
-        return parser
+    def _load_last_results(self):
+        """Recupera os resultados da última busca quando esta instância ainda não buscou."""
+        if self.cached_results or self.search_cache is None:
+            return
+        data = self.search_cache.get_json(_LAST_RESULTS_KEY) or {}
+        try:
+            # Chaves JSON são strings: volta ao índice inteiro
+            self.cached_results = {int(idx): _score_from_dict(item) for idx, item in data.items()}
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Resultados de busca em cache inválidos: {e}")
+            self.cached_results = {}
 
     def run(self, args: Optional[List[str]] = None):
-        parsed_args = self.parser.parse_args(args)
-        return self._execute_command(parsed_args)
+        argv = sys.argv[1:] if args is None else args
+        # Monta apenas o subparser do comando pedido (o primeiro argumento).
+        # Qualquer outro valor usa o parser completo: a chave do lru_cache fica
+        # limitada aos subcomandos conhecidos
+        command = argv[0] if argv else None
+        if command not in _SUBCOMMANDS:
+            command = None
+        parsed_args = _build_parser(command).parse_args(argv)
+        try:
+            return self._execute_command(parsed_args)
+        finally:
+            self.close()
+
+    def _run_async(self, coro):
+        """Executa uma corrotina no event loop persistente da instância.
+
+        Evita criar e destruir um loop a cada chamada (como faz asyncio.run),
+        o que pesa quando vários downloads são feitos em sequência.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def close(self):
+        """Fecha os clientes HTTP (API e downloads) e o event loop persistente, se houver."""
+        # Só fecha o que foi de fato criado (propriedades preguiçosas)
+        if self._loop is not None and not self._loop.is_closed():
+            if 'download_manager' in self.__dict__:
+                self._loop.run_until_complete(self.download_manager.aclose())
+            self._loop.close()
+        self._loop = None
+        if 'api_client' in self.__dict__:
+            self.api_client.close()
 
     def _execute_command(self, args):
         command = args.command
@@ -178,11 +507,13 @@ class CLIInterface:
         elif command == "config":
             return self._cmd_config(args)
         else:
-            self.parser.print_help()
+            _build_parser().print_help()
             return 1
 
     # --- Commands ---
     def _cmd_search(self, args):
+        from ..core.search_engine import SearchFilter
+
         # Monta query como string única a partir de múltiplas keywords
         query = " ".join(args.query).strip()
 
@@ -190,8 +521,8 @@ class CLIInterface:
         search_conf = self.config_manager.get("search", {})
         # novo: "max-results" define itens por página (padrão 100, máximo 100)
         per_page = (
-            args.max_results if getattr(args, 'max_results', None) is not None else (
-                args.per_page if getattr(args, 'per_page', None) is not None else search_conf.get("results_per_page", None)
+            args.max_results if args.max_results is not None else (
+                args.per_page if args.per_page is not None else search_conf.get("results_per_page", None)
             )
         )
         if per_page is None:
@@ -200,48 +531,65 @@ class CLIInterface:
             print("Erro: --max-results deve ser no máximo 100.")
             return 1
         # Limite total legado (mantido por compatibilidade)
-        max_results = args.limit if getattr(args, 'limit', None) is not None else search_conf.get("max_results", per_page)
+        max_results = args.limit if args.limit is not None else search_conf.get("max_results", per_page)
 
         # Filtros
         search_filter = SearchFilter(
-            platforms=args.platform if getattr(args, 'platform', None) else None,
-            regions=args.region if getattr(args, 'region', None) else None,
-            year_min=args.year if getattr(args, 'year', None) else None,
-            year_max=args.year if getattr(args, 'year', None) else None,
+            platforms=args.platform or None,
+            regions=args.region or None,
+            year_min=args.year or None,
+            year_max=args.year or None,
         )
 
         # Reseta cache para nova busca
-        self.cached_results = []
+        self.cached_results = {}
         self.cached_query = query
         self.cached_filter = search_filter
         self.cached_total = 0
 
         # Página inicial (alinhado ao model.md)
-        page = args.page if getattr(args, 'page', None) else 1
+        page = args.page or 1
+        use_cache = not args.no_cache
+        interactive = bool(search_conf.get("interactive", False))
+        # Páginas já obtidas nesta busca: voltar com [p] não refaz a consulta
+        pages = {}
+        total = None
         while True:
-            paged = self.search_engine.search_paged_sync(
-                query=query,
-                search_filter=search_filter,
-                page=page,
-                per_page=per_page,
-                max_results=max_results,
-            )
+            paged = pages.get(page)
+            new_page = paged is None
+            if new_page:
+                paged = self._search_page(
+                    query, search_filter, page, per_page, max_results, use_cache
+                )
+                if paged.failed:
+                    # Falha na API não é "sem resultados": mantém os resultados salvos
+                    print("Erro: falha ao consultar a API de busca.")
+                    return 1
+                pages[page] = paged
+            # O total vem junto da primeira página e vale para toda a navegação
+            if total is None:
+                total = paged.total
+                # Busca sem resultados: nada a paginar, numerar ou selecionar.
+                # JSON/CSV seguem para emitir o envelope/cabeçalho vazio.
+                if total == 0 and args.format == "table":
+                    print("Nenhum resultado encontrado.")
+                    self._save_last_results()  # índices da busca anterior deixam de valer
+                    return 0
 
-            # Atualiza cache agregando itens para numeração contínua
-            # Garante que cached_results tenha espaço até o índice exibido
-            start_idx = (page - 1) * per_page
-            # Insere/atualiza posições com itens da página
-            for i, item in enumerate(paged.items, start=start_idx):
-                if i < len(self.cached_results):
+            # Atualiza cache agregando itens para numeração contínua (índice global da página).
+            # Página já vista (voltar com [p], entrada inválida) não muda nada a gravar.
+            if new_page:
+                start_idx = (page - 1) * per_page
+                for i, item in enumerate(paged.items, start=start_idx):
                     self.cached_results[i] = item
-                else:
-                    self.cached_results.append(item)
-            self.cached_total = paged.total
+                    self._remember_rom(item.rom_entry)
+                self.cached_total = total
+                self._save_last_results()
 
             # Exibição
             self._display_search_results(
                 items=paged.items,
-                total=paged.total,
+                total=total,
                 page=page,
                 per_page=per_page,
                 format_type=args.format,
@@ -251,24 +599,30 @@ class CLIInterface:
             if args.format != "table":
                 break
 
-            # Prompt de ação combinado: seleção por índices ou navegação
-            # Removido no CLI para evitar pausas: não exibir prompt nem ler entrada
-            break
+            # Prompt de ação combinado: seleção por índices ou navegação.
+            # Desligado por padrão para não pausar scripts (search.interactive)
+            if not interactive:
+                break
             start_num = (page - 1) * per_page + 1
-            end_num = min(paged.total, page * per_page)
+            end_num = min(total, page * per_page)
+            # Não avança além do limite total solicitado (--limit / search.max_results)
+            limit_reached = end_num >= max_results
+            has_next = paged.has_next and not limit_reached
             action_prompt = "> Digite o(s) número(s) referentes as roms para baixar (separados por vírgula), ou [n] próxima pág, [p] pág anterior, [0] cancelar, [q] sair: "
-            sys.stdout.write(action_prompt)
-            sys.stdout.flush()
-            choice = sys.stdin.readline()
-            if not choice:
+            try:
+                choice = input(action_prompt)
+            except EOFError:
                 break
             choice = choice.strip().lower()
 
             # Navegação
-            if choice in ('n', 'p', 'q', '0'):
-                if choice == 'n' and paged.has_next:
+            if choice in _NAV_KEYS:
+                if choice == 'n' and has_next:
                     page += 1
                     continue
+                elif choice == 'n' and limit_reached:
+                    print(f"Limite de {max_results} resultados atingido.")
+                    continue
                 elif choice == 'p' and paged.has_prev:
                     page = max(1, page - 1)
                     continue
@@ -280,12 +634,11 @@ class CLIInterface:
                     continue
 
             # Tentativa de seleção por índices (números separados por vírgula)
-            tokens = [tok.strip() for tok in choice.replace(' ', '').split(',') if tok.strip()]
-            if not tokens or any(not tok.isdigit() for tok in tokens):
+            if not _INDEX_RE.match(choice):
                 print("Entrada inválida. Use números separados por vírgula (ex.: 1,3,5) ou comandos [n],[p],[0],[q].")
                 continue
 
-            indices = [int(tok) for tok in tokens]
+            indices = list(map(int, _DIGITS_RE.findall(choice)))
             # Validar se índices pertencem à página atual
             invalid = [idx for idx in indices if idx < start_num or idx > end_num]
             if invalid:
@@ -293,29 +646,38 @@ class CLIInterface:
                 continue
 
             # Remover duplicados preservando ordem
-            seen = set()
-            unique_indices = []
-            for idx in indices:
-                if idx not in seen:
-                    seen.add(idx)
-                    unique_indices.append(idx)
-
-            # Efetuar downloads sequenciais usando o comando 'download'
-            import argparse as _argparse
-            for idx in unique_indices:
-                dl_args = _argparse.Namespace(target=str(idx), output='.', romid=None, slug=None, platform=None, region=None, no_boxart=False, force=False, silence=False)
-                self._cmd_download(dl_args)
-            break
+            unique_indices = list(dict.fromkeys(indices))
+
+            # Efetuar downloads em paralelo (limitado por download.max_concurrent)
+            roms = [self.cached_results[idx - 1].rom_entry for idx in unique_indices]
+            return 0 if self._run_async(self._download_many(roms)) else 1
 
         return 0
 
+    def _remember_rom(self, rom):
+        """Indexa a ROM por slug e rom_id para consultas seguintes na sessão."""
+        cache = self._info_cache
+        for key in (rom.slug, rom.rom_id):
+            if key:
+                cache[key] = rom
+                cache.move_to_end(key)
+        while len(cache) > self._INFO_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _get_rom_info(self, key: str):
+        """get_rom_info memoizado na sessão (inclui as ROMs vindas da busca)."""
+        rom = self._info_cache.get(key)
+        if rom is not None:
+            self._info_cache.move_to_end(key)
+        else:
+            rom = self._run_async(self.search_engine.get_rom_info(key))
+            if rom:
+                self._remember_rom(rom)
+        return rom
+
     def _cmd_info(self, args):
         rom_id = args.rom_id
-        info = self.search_engine.get_rom_info_sync(rom_id) if hasattr(self.search_engine, 'get_rom_info_sync') else None
-        # Fallback assíncrono caso não exista método sync específico
-        if info is None:
-            import asyncio
-            info = asyncio.run(self.search_engine.get_rom_info(rom_id))
+        info = self._get_rom_info(rom_id)
         if not info:
             print("ROM não encontrada.")
             return 1
@@ -323,35 +685,36 @@ class CLIInterface:
         return 0
 
     def _cmd_download(self, args):
-        target = getattr(args, 'target', None)
-        output_dir = getattr(args, 'output', '.')
-        romid = getattr(args, 'romid', None)
-        slug = getattr(args, 'slug', None)
-        no_boxart = getattr(args, 'no_boxart', False)
+        target = args.target
+        output_dir = args.output
+        romid = args.romid
+        slug = args.slug
+        no_boxart = args.no_boxart
+        silence = args.silence
         # platform/region flags aceitos para alinhamento, atualmente sem efeito direto aqui
-        _platforms = getattr(args, 'platform', None)
-        _regions = getattr(args, 'region', None)
+        _platforms = args.platform
+        _regions = args.region
 
         # Resolve ROM
         rom = None
         if romid or slug:
             rom_key = romid or slug
-            import asyncio
-            rom = asyncio.run(self.search_engine.get_rom_info(rom_key))
+            rom = self._get_rom_info(rom_key)
             if not rom:
                 print("ROM não encontrada pelo identificador informado.")
                 return 1
         elif target:
             if target.isdigit():
+                self._load_last_results()
                 idx = int(target) - 1
-                if 0 <= idx < len(self.cached_results):
-                    rom = self.cached_results[idx].rom_entry
+                item = self.cached_results.get(idx)
+                if item is not None:
+                    rom = item.rom_entry
                 else:
                     print("Índice fora do intervalo. Execute uma busca primeiro e escolha um índice válido.")
                     return 1
             else:
-                import asyncio
-                rom = asyncio.run(self.search_engine.get_rom_info(target))
+                rom = self._get_rom_info(target)
                 if not rom:
                     print("ROM não encontrada pelo ID informado.")
                     return 1
@@ -361,12 +724,11 @@ class CLIInterface:
 
         # Realiza download usando DownloadManager
         try:
-            import asyncio
-            result = asyncio.run(
+            result = self._run_async(
                 self.download_manager.download_rom(
                     rom,
                     download_boxart=(not no_boxart),
-                    progress_callback=self._download_progress_callback
+                    progress_callback=self._progress_callback(silence)
                 )
             )
 
@@ -378,14 +740,20 @@ class CLIInterface:
             final_path = result.final_path
 
             # Se usuário especificou diretório de saída customizado, mover arquivo
-            if output_dir and output_dir != '.':
+            if final_path and output_dir and output_dir != '.':
                 try:
                     os.makedirs(output_dir, exist_ok=True)
-                    import shutil
-                    dest_path = os.path.join(output_dir, os.path.basename(final_path)) if final_path else os.path.join(output_dir, f"{rom.slug}.zip")
-                    # Move para o destino especificado pelo usuário
-                    if final_path and os.path.abspath(final_path) != os.path.abspath(dest_path):
-                        shutil.move(final_path, dest_path)
+                    # Mesmo diretório (inclusive via link ou caminho relativo): nada a mover
+                    if not os.path.samefile(os.path.dirname(final_path) or '.', output_dir):
+                        dest_path = os.path.join(output_dir, os.path.basename(final_path))
+                        # Move para o destino especificado pelo usuário: rename(2) no mesmo
+                        # sistema de arquivos; cópia + remoção só entre dispositivos
+                        try:
+                            os.replace(final_path, dest_path)
+                        except OSError as e:
+                            if e.errno != errno.EXDEV:
+                                raise
+                            shutil.move(final_path, dest_path)
                         final_path = dest_path
                 except Exception as move_err:
                     logger.warning(f"Não foi possível mover para o diretório de saída especificado: {move_err}")
@@ -396,36 +764,61 @@ class CLIInterface:
             logger.error(f"Erro no download: {e}")
             return 1
 
+    async def _download_many(self, roms):
+        """Baixa várias ROMs concorrentemente no event loop da instância.
+
+        A concorrência é limitada pelo semáforo do DownloadManager
+        (download.max_concurrent). O callback de progresso é definido uma única
+        vez para o lote, pois download_rom() o troca/restaura a cada chamada.
+        """
+        self._batch_files = {}
+        self._batch_size = len(roms)
+        self._batch_ts = 0.0
+        prev_cb = self.download_manager.progress_callback
+        self.download_manager.set_progress_callback(self._progress_callback(batch=True))
+        try:
+            results = await self.download_manager.download_multiple_roms(roms)
+        finally:
+            self.download_manager.progress_callback = prev_cb
+        failures = 0
+        for rom, result in zip(roms, results):
+            if result.success:
+                print(f"\nBaixado: {result.final_path}")
+            else:
+                failures += 1
+                print(f"\n{rom.title}: {result.error or 'Falha desconhecida no download'}")
+        return failures == 0
+
     def _cmd_boxart(self, args):
-        target = getattr(args, 'target', None)
-        romid = getattr(args, 'romid', None)
-        slug = getattr(args, 'slug', None)
-        # platform/region/force/silence aceitos, porém não utilizados diretamente aqui
-        _platforms = getattr(args, 'platform', None)
-        _regions = getattr(args, 'region', None)
-        _force = getattr(args, 'force', False)
-        _silence = getattr(args, 'silence', False)
+        target = args.target
+        romid = args.romid
+        slug = args.slug
+        # platform/region/force aceitos, porém não utilizados diretamente aqui
+        _platforms = args.platform
+        _regions = args.region
+        _force = args.force
+        silence = args.silence
 
         # Resolve ROM
         rom = None
         if romid or slug:
             rom_key = romid or slug
-            import asyncio
-            rom = asyncio.run(self.search_engine.get_rom_info(rom_key))
+            rom = self._get_rom_info(rom_key)
             if not rom:
                 print("ROM não encontrada pelo identificador informado.")
                 return 1
         elif target:
             if target.isdigit():
+                self._load_last_results()
                 idx = int(target) - 1
-                if 0 <= idx < len(self.cached_results):
-                    rom = self.cached_results[idx].rom_entry
+                item = self.cached_results.get(idx)
+                if item is not None:
+                    rom = item.rom_entry
                 else:
                     print("Índice fora do intervalo. Execute uma busca primeiro e escolha um índice válido.")
                     return 1
             else:
-                import asyncio
-                rom = asyncio.run(self.search_engine.get_rom_info(target))
+                rom = self._get_rom_info(target)
                 if not rom:
                     print("ROM não encontrada pelo ID informado.")
                     return 1
@@ -440,11 +833,10 @@ class CLIInterface:
         try:
             # Se disponível, usa o método específico do DownloadManager
             if hasattr(self.download_manager, 'download_boxart'):
-                import asyncio
-                saved_path = asyncio.run(
+                saved_path = self._run_async(
                     self.download_manager.download_boxart(
                         rom,
-                        progress_callback=self._download_progress_callback
+                        progress_callback=self._progress_callback(silence)
                     )
                 )
                 if not saved_path:
@@ -460,25 +852,23 @@ class CLIInterface:
             return 1
 
     def _cmd_random(self, args):
-        count = max(1, int(getattr(args, 'count', 1) or 1))
+        from ..core.search_engine import SearchFilter
+
+        count = max(1, args.count or 1)
         search_filter = SearchFilter(
-            platforms=getattr(args, 'platform', None) or None,
-            regions=getattr(args, 'region', None) or None,
+            platforms=args.platform or None,
+            regions=args.region or None,
         )
         try:
-            roms = None
-            if hasattr(self.search_engine, 'get_random_roms_sync'):
-                roms = self.search_engine.get_random_roms_sync(count=count, search_filter=search_filter)
-            else:
-                import asyncio
-                if hasattr(self.search_engine, 'get_random_roms'):
-                    roms = asyncio.run(self.search_engine.get_random_roms(count=count, search_filter=search_filter))
+            roms = self._run_async(self.search_engine.search_random(search_filter, count))
             if not roms:
                 print("Nenhuma ROM encontrada.")
                 return 1
-            for i, r in enumerate(roms, start=1):
-                regions_str = ",".join(r.regions or [])
-                print(f"{i}. {r.title} | {r.platform} | {regions_str} | {r.slug}")
+            # Lista inteira montada e escrita de uma vez
+            sys.stdout.write("".join(
+                f"{i}. {r.title} | {r.platform} | {','.join(r.regions or ())} | {r.slug}\n"
+                for i, r in enumerate(roms, start=1)
+            ))
             return 0
         except Exception as e:
             logger.error(f"Erro ao obter ROMs aleatórias: {e}")
@@ -486,15 +876,8 @@ class CLIInterface:
 
     def _cmd_platforms(self, args):
         try:
-            items = None
-            if hasattr(self.search_engine, 'get_platforms_sync'):
-                items = self.search_engine.get_platforms_sync() or []
-            else:
-                import asyncio
-                if hasattr(self.search_engine, 'get_platforms'):
-                    items = asyncio.run(self.search_engine.get_platforms()) or []
-            for p in (items or []):
-                print(p)
+            items = self._run_async(self.search_engine.get_platforms())
+            sys.stdout.write("".join(f"{p}\n" for p in items or ()))
             return 0
         except Exception as e:
             logger.error(f"Erro ao listar plataformas: {e}")
@@ -502,15 +885,8 @@ class CLIInterface:
 
     def _cmd_regions(self, args):
         try:
-            items = None
-            if hasattr(self.search_engine, 'get_regions_sync'):
-                items = self.search_engine.get_regions_sync() or []
-            else:
-                import asyncio
-                if hasattr(self.search_engine, 'get_regions'):
-                    items = asyncio.run(self.search_engine.get_regions()) or []
-            for r in (items or []):
-                print(r)
+            items = self._run_async(self.search_engine.get_regions())
+            sys.stdout.write("".join(f"{r}\n" for r in items or ()))
             return 0
         except Exception as e:
             logger.error(f"Erro ao listar regiões: {e}")
@@ -520,38 +896,35 @@ class CLIInterface:
         """Gerencia configurações via linha de comando."""
         cm = self.config_manager
         try:
-            if getattr(args, 'list', False):
+            if args.list:
                 data = cm.get_all()
                 if args.format == 'yaml':
-                    print(yaml.safe_dump(data, sort_keys=False, allow_unicode=True))
+                    import yaml
+
+                    print(yaml.dump(data, Dumper=SafeDumper, sort_keys=False, allow_unicode=True))
                 else:
-                    print(json.dumps(data, ensure_ascii=False, indent=2))
+                    print(_json_dumps(data, indent=True))
                 return 0
-            if getattr(args, 'get', None):
+            if args.get:
                 key = args.get
                 value = cm.get(key, None)
                 if isinstance(value, (dict, list)):
-                    print(json.dumps(value, ensure_ascii=False, indent=2))
+                    print(_json_dumps(value, indent=True))
                 else:
                     print(value)
                 return 0
-            if getattr(args, 'set', None):
+            if args.set:
                 key, value_str = args.set[0], args.set[1]
                 # Conversões básicas de tipo
-                parsed: Optional[object] = value_str
-                low = value_str.strip().lower()
-                if low in ('true', 'false'):
-                    parsed = (low == 'true')
-                elif low in ('null', 'none'):
-                    parsed = None
-                else:
-                    try:
-                        if '.' in value_str:
-                            parsed = float(value_str)
-                        else:
-                            parsed = int(value_str)
-                    except ValueError:
-                        parsed = value_str  # mantém string
+                parsed: Optional[object] = value_str  # padrão: mantém string
+                stripped = value_str.strip()
+                low = stripped.lower()
+                if low in _CONFIG_LITERALS:
+                    parsed = _CONFIG_LITERALS[low]
+                elif _INT_VALUE_RE.fullmatch(stripped):
+                    parsed = int(stripped)
+                elif _FLOAT_VALUE_RE.fullmatch(stripped):
+                    parsed = float(stripped)
                 ok = cm.set(key, parsed)
                 if not ok:
                     print(f"Falha ao definir {key}")
@@ -563,14 +936,14 @@ class CLIInterface:
                 else:
                     print("Falha ao salvar configuração.")
                     return 1
-            if getattr(args, 'save', False):
+            if args.save:
                 if cm.save_config():
                     print("Configuração salva.")
                     return 0
                 else:
                     print("Falha ao salvar configuração.")
                     return 1
-            if getattr(args, 'reset', False):
+            if args.reset:
                 if cm.create_default_config():
                     cm.load_config()
                     print("Configuração resetada para o padrão.")
@@ -589,143 +962,158 @@ class CLIInterface:
     # --- Display helpers ---
     def _display_search_results(self, items, total: int, page: int, per_page: int, format_type: str = "table"):
         if format_type == "json":
-            out = [
-                {
-                    "index": (page - 1) * per_page + i + 1,
-                    "slug": s.rom_entry.slug,
-                    "title": s.rom_entry.title,
-                    "platform": s.rom_entry.platform,
-                    "regions": s.rom_entry.regions,
-                    "year": s.rom_entry.year if hasattr(s.rom_entry, 'year') else None,
-                    "hosts": getattr(s.rom_entry, 'hosts', None),
-                    "format": getattr(s.rom_entry, 'file_format', None),
-                    "size": getattr(s.rom_entry, 'size', None),
-                    "score": round(s.total_score, 3),
-                }
-                for i, s in enumerate(items)
-            ]
-            print(json.dumps({"total": total, "page": page, "per_page": per_page, "items": out}, ensure_ascii=False, indent=2))
+            # Emite item a item direto no stdout, sem materializar a lista completa
+            out = sys.stdout
+            try:
+                # Envelope compacto, como os itens gerados por _json_dumps
+                out.write(f'{{"total":{int(total)},"page":{int(page)},"per_page":{int(per_page)},"items":[')
+                first = (page - 1) * per_page + 1
+                for i, s in enumerate(items, start=first):
+                    if i != first:
+                        out.write(",")
+                    out.write(_json_dumps(_score_to_record(s, i)))
+                out.write("]}\n")
+                out.flush()
+            except BrokenPipeError:
+                _silence_broken_pipe()
             return
         elif format_type == "csv":
-            import csv
-            import io
-            buffer = io.StringIO()
-            writer = csv.writer(buffer)
-            writer.writerow(["index", "slug", "title", "platform", "regions", "hosts", "format", "size_bytes", "score"])
-            for i, s in enumerate(items):
-                idx = (page - 1) * per_page + i + 1
-                regions_str = ",".join(s.rom_entry.regions or [])
-                hosts_val = getattr(s.rom_entry, 'hosts', None) or ""
-                fmt_val = getattr(s.rom_entry, 'file_format', None) or ""
-                size_val = getattr(s.rom_entry, 'size', None)
-                writer.writerow([idx, s.rom_entry.slug, s.rom_entry.title, s.rom_entry.platform, regions_str, hosts_val, fmt_val, size_val if size_val is not None else "", f"{s.total_score:.3f}"])
-            print(buffer.getvalue().rstrip("\n"))
+            try:
+                writer = csv.writer(sys.stdout)
+                writer.writerow(["index", "slug", "title", "platform", "regions", "hosts", "format", "size_bytes", "score"])
+                first = (page - 1) * per_page + 1
+                writer.writerows(_score_to_csv_row(s, i) for i, s in enumerate(items, start=first))
+                sys.stdout.flush()
+            except BrokenPipeError:
+                _silence_broken_pipe()
             return
 
         # Tabela: cabeçalho de paginação
         start_num = (page - 1) * per_page + 1
         end_num = min(total, page * per_page)
         total_pages = max(1, (total + per_page - 1) // per_page)
-        print(f"Resultados {start_num}-{end_num} de {total} (Página {page} de {total_pages})")
-
-        # Larguras de colunas
-        w_title = 38
-        w_id = 10
-        w_platform = 9
-        w_regions = 4
-        w_hosts = 12
-        w_format = 7
-        w_size = 9
-        w_score = 6
-
-        # Cabeçalho da tabela
-        header = (
-            "#".rjust(w_idx) + " " +
-            "Título".ljust(w_title) + " " +
-            "ID".ljust(w_id) + " " +
-            "Platform".ljust(w_platform) + " " +
-            "Reg.".ljust(w_regions) + " " +
-            "Hosts".ljust(w_hosts) + " " +
-            "Format".ljust(w_format) + " " +
-            "Size".rjust(w_size) + " " +
-            "Score"
-        )
-        sep = (
-            "-" * w_idx + " " +
-            "-" * w_title + " " +
-            "-" * w_id + " " +
-            "-" * w_platform + " " +
-            "-" * w_regions + " " +
-            "-" * w_hosts + " " +
-            "-" * w_format + " " +
-            "-" * w_size + " " +
-            "-" * 5
-        )
-        print(header)
-        print(sep)
+        rows = [
+            f"Resultados {start_num}-{end_num} de {total} (Página {page} de {total_pages})",
+            _TABLE_HEADER,
+            _TABLE_SEP,
+        ]
 
-        # Linhas
+        row_fmt = _TABLE_ROW_FMT
         for i, s in enumerate(items):
-            idx = start_num + i
-            rom = s.rom_entry
+            slug, romid, title, platform, regions, _year, hosts, fmt, size, score = _ROW_FIELDS(s)
 
-            title = (getattr(rom, 'title', '') or '')
-            title = (title[:w_title-1] + '…') if len(title) > w_title else title
-            title = title.ljust(w_title)
+            title = title or ''
+            if len(title) > _W_TITLE:
+                title = title[:_W_TITLE - 1] + '…'
 
-            romid = (getattr(rom, 'rom_id', None) or getattr(rom, 'slug', '') or '')
-            romid = romid[:w_id].ljust(w_id)
+            size_str = format_file_size_cached(size) if isinstance(size, int) and size >= 0 else ""
 
-            platform = (getattr(rom, 'platform', '') or '')[:w_platform].ljust(w_platform)
+            rows.append(row_fmt(
+                start_num + i,
+                title,
+                romid or slug or '',
+                platform or '',
+                ",".join(regions or ()),
+                str(hosts or ""),
+                str(fmt or ""),
+                size_str,
+                score,
+            ))
 
-            regions = ",".join(getattr(rom, 'regions', None) or [])
-            regions = regions[:w_regions].ljust(w_regions)
+        # Uma única escrita no stdout em vez de um print() por linha
+        sys.stdout.write("\n".join(rows))
+        sys.stdout.write("\n")
 
-            hosts_val = getattr(rom, 'hosts', None) or ""
-            hosts_val = str(hosts_val)[:w_hosts].ljust(w_hosts)
-
-            fmt_val = getattr(rom, 'file_format', None) or ""
-            fmt_val = str(fmt_val)[:w_format].ljust(w_format)
-
-            size_val = getattr(rom, 'size', None)
-            size_str = format_file_size(size_val) if isinstance(size_val, int) and size_val >= 0 else ""
-            size_str = size_str[:w_size].rjust(w_size)
-
-            score_str = f"{s.total_score:>{w_score}.3f}"
-
-            print(f"{str(idx).rjust(w_idx)} {title} {romid} {platform} {regions} {hosts_val} {fmt_val} {size_str} {score_str}")
-
-        if end_num >= total:
-            # Não imprimir mensagem de fim no CLI para evitar saídas interativas
-            # Removido: print("-- Fim dos resultados --")
+        # Não imprimir mensagem de fim no CLI para evitar saídas interativas
+        # Removido: print("-- Fim dos resultados --")
 
     def _display_rom_info(self, rom, format_type: str = "table"):
         if format_type == "json":
-            print(json.dumps(rom.__dict__, ensure_ascii=False, indent=2))
+            print(_json_dumps({f: getattr(rom, f, None) for f in self._ROM_JSON_FIELDS}, indent=True))
             return
-        # tabela
-        print(f"Slug: {rom.slug}")
-        print(f"Título: {rom.title}")
-        print(f"Plataforma: {rom.platform}")
-        print(f"Regiões: {', '.join(rom.regions or [])}")
+        # tabela: monta o bloco inteiro e escreve uma única vez
+        lines = [
+            f"Slug: {rom.slug}",
+            f"Título: {rom.title}",
+            f"Plataforma: {rom.platform}",
+            f"Regiões: {', '.join(rom.regions or ())}",
+        ]
         size = getattr(rom, 'size', None)
         if size is not None:
-            print(f"Tamanho: {format_file_size(size)}")
-        print("Links:")
-        for link in (rom.links or []):
-            print(f"- {link.get('type')}: {link.get('url')}")
+            lines.append(f"Tamanho: {format_file_size(size)}")
+        lines.append("Links:")
+        lines.extend(f"- {link.get('type')}: {link.get('url')}" for link in rom.links or ())
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+
+    def _progress_callback(self, silence: bool = False, batch: bool = False):
+        """Callback de progresso a usar, ou None com --silence ou interface.show_progress falso.
+
+        Sem callback o DownloadManager nem monta os eventos de progresso.
+        """
+        if silence or not (self.config_manager.get('interface', {}) or {}).get('show_progress', True):
+            return None
+        return self._batch_progress_callback if batch else self._download_progress_callback
 
     def _download_progress_callback(self, progress: DownloadProgress):
-        """Callback de progresso compatível com DownloadManager."""
+        """Callback de progresso compatível com DownloadManager.
+
+        Limita a escrita no terminal a no máximo uma atualização a cada 50 ms ou
+        a cada 1% de avanço; mudanças de status e a conclusão sempre são exibidas.
+        """
         try:
-            pct = getattr(progress, 'percentage', None)
-            status = getattr(progress, 'status', '')
-            if pct is not None:
-                sys.stdout.write(f"\rBaixando: {pct:.1f}% ({status})")
-            else:
-                sys.stdout.write(f"\rBaixando... ({status})")
-            sys.stdout.flush()
+            try:
+                pct = progress.percentage
+                status = progress.status
+                key = progress.filename
+                finished = progress.downloaded == progress.total_size
+            except AttributeError:
+                pct, status, key, finished = None, '', None, False
+            now = time.monotonic()
+            last_ts, last_pct, last_status = self._progress_state.get(key, (0.0, -1.0, None))
+            if (
+                status == last_status
+                and not finished
+                and now - last_ts < 0.05
+                and (pct is None or abs(pct - last_pct) < 1.0)
+            ):
+                return
+            self._progress_state[key] = (now, pct if pct is not None else -1.0, status)
+            self._write_progress(
+                _PROGRESS_PCT_FMT(pct, status) if pct is not None else _PROGRESS_NO_PCT_FMT(status)
+            )
         except Exception:
             # fallback silencioso para não interromper o fluxo em caso de incompatibilidades
-            sys.stdout.write("\rBaixando...")
-            sys.stdout.flush()
\ No newline at end of file
+            self._write_progress("Baixando...")
+
+    def _batch_progress_callback(self, progress: DownloadProgress):
+        """Callback de progresso de um lote: uma única linha com o total agregado.
+
+        Com downloads simultâneos, cada arquivo reescreveria a mesma linha com seu
+        próprio percentual; aqui o estado de cada um é guardado e a linha mostra a
+        soma. Atualizações de bytes são limitadas a uma a cada 50 ms.
+        """
+        try:
+            status = getattr(progress, 'status', '')
+            self._batch_files[progress.filename] = (progress.downloaded, progress.total_size, status)
+            now = time.monotonic()
+            if status == 'downloading' and now - self._batch_ts < 0.05:
+                return
+            self._batch_ts = now
+            downloaded = total = completed = 0
+            for done, size, st in self._batch_files.values():
+                downloaded += done
+                total += size
+                completed += st == 'completed'
+            pct = downloaded * 100 / total if total > 0 else 0.0
+            self._write_progress(_BATCH_PROGRESS_FMT(pct, completed, self._batch_size))
+        except Exception:
+            self._write_progress("Baixando...")
+
+    def _write_progress(self, line: str):
+        """Escreve uma linha de progresso: sobrescreve no terminal, acumula fora dele."""
+        if self._stdout_isatty:
+            sys.stdout.write(f"\r{line}")
+            sys.stdout.flush()
+        else:
+            sys.stdout.write(f"{line}\n")
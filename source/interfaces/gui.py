@@ -11,11 +11,12 @@ License: GPL-3.0
 """
 
 import sys
+import time
 import asyncio
+import functools
 from typing import List, Optional, Dict, Any, Callable
 from pathlib import Path
 from threading import Thread
-import time
 from loguru import logger
 
 try:
@@ -27,8 +28,8 @@ try:
         QCheckBox, QGroupBox, QSplitter, QTabWidget
     )
     from PyQt6.QtCore import (
-        Qt, QTimer, QThread, pyqtSignal, QObject, QSize, QRect,
-        QPropertyAnimation, QEasingCurve, QParallelAnimationGroup
+        Qt, QTimer, QThread, pyqtSignal, pyqtSlot, QObject, QSize, QRect,
+        QPropertyAnimation, QEasingCurve, QParallelAnimationGroup, QMetaObject, Q_ARG
     )
     from PyQt6.QtGui import (
         QFont, QPixmap, QPalette, QColor, QKeyEvent, QFocusEvent,
@@ -90,16 +91,98 @@ except ImportError:
     QPainter = DummyQtClass
     QBrush = DummyQtClass
     QLinearGradient = DummyQtClass
+    QMetaObject = DummyQtClass
     def pyqtSignal(*args): return lambda x: x
+    def pyqtSlot(*args, **kwargs): return lambda x: x
+    def Q_ARG(*args): return None
 
 # Lazy pygame import: only load when GUI initializes gamepad handling
 pygame = None
 
-from ..core import DirectoryManager, ConfigManager, LogManager, SearchEngine, SearchFilter
+try:
+    import qasync
+except ImportError:
+    # Optional: without it asyncio work runs in background threads
+    qasync = None
+
+from ..core import DirectoryManager, ConfigManager, LogManager, SearchEngine, SearchFilter, CacheManager
 from ..core.crocdb_client import CrocDBClient, ROMEntry
 from ..core import DownloadManager, DownloadProgress
 from ..locales import get_i18n, t
-from ..core.helpers import format_file_size, sanitize_filename
+from ..core.helpers import format_file_size, format_file_size_cached, sanitize_filename
+
+
+@functools.lru_cache(maxsize=None)
+def _font(family: str, size: int, bold: bool = False) -> QFont:
+    """Shared QFont per (family, size, weight); built on first use, after QApplication."""
+    if bold:
+        return QFont(family, size, QFont.Weight.Bold)
+    return QFont(family, size)
+
+
+def _call_in_gui_thread(slot: Callable, *typed_args) -> None:
+    """Queue a call to a @pyqtSlot bound method on its object's (GUI) thread.
+
+    Safe to use from worker threads. Arguments are (type, value) pairs
+    matching the slot signature, e.g. (list, roms).
+    """
+    QMetaObject.invokeMethod(
+        slot.__self__, slot.__name__, Qt.ConnectionType.QueuedConnection,
+        *(Q_ARG(arg_type, value) for arg_type, value in typed_args)
+    )
+
+
+# Widget stylesheets, shared so each is a single string object
+# Row styles for ROMListWidget items
+_ROM_ITEM_SELECTED_CSS = """
+    QFrame {
+        background-color: #4a5568;
+        border: 2px solid #00ff00;
+        border-radius: 5px;
+        padding: 10px;
+    }
+"""
+_ROM_ITEM_UNSELECTED_CSS = """
+    QFrame {
+        background-color: #2d3748;
+        border: 1px solid #4a5568;
+        border-radius: 5px;
+        padding: 10px;
+    }
+"""
+_ROM_TITLE_CSS = "color: white;"
+_ROM_DETAILS_CSS = "color: #a0aec0;"
+
+# Focus highlight for FocusableWidget and the BigButton base look
+_FOCUS_CSS = """
+    border: 3px solid #00ff00;
+    background-color: rgba(0, 255, 0, 30);
+"""
+_UNFOCUS_CSS = ""
+_BIG_BUTTON_CSS = """
+    BigButton {
+        background-color: #2d3748;
+        border: 2px solid #4a5568;
+        border-radius: 10px;
+        color: white;
+    }
+    BigButton:hover {
+        background-color: #4a5568;
+    }
+"""
+_PROGRESS_BAR_CSS = """
+    QProgressBar {
+        border: 2px solid #4a5568;
+        border-radius: 5px;
+        text-align: center;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QProgressBar::chunk {
+        background-color: #00ff00;
+        border-radius: 3px;
+    }
+"""
 
 
 class GamepadManager(QObject):
@@ -112,11 +195,29 @@ class GamepadManager(QObject):
     dpad_moved = pyqtSignal(str)  # Direction: 'up', 'down', 'left', 'right'
     analog_moved = pyqtSignal(float, float)  # X, Y values
     
-    def __init__(self):
+    # Seconds after the last event during which the active interval is used
+    ACTIVE_WINDOW = 1.0
+    
+    def __init__(self, poll_interval_ms: int = 16, idle_interval_ms: int = 100):
+        """
+        Args:
+            poll_interval_ms: Poll interval while the gamepad is in use
+            idle_interval_ms: Poll interval once no event arrived for ACTIVE_WINDOW
+        """
         super().__init__()
         self.joystick = None
         self.running = False
-        self.thread = None
+        
+        self._active_interval_ms = poll_interval_ms
+        self._idle_interval_ms = idle_interval_ms
+        self._last_event_ts = time.monotonic()
+        
+        # Polled from the Qt event loop, so the signals are delivered directly
+        # on the GUI thread, not queued across threads. Starts idle and speeds
+        # up to the active interval as soon as the gamepad is used.
+        self._timer = QTimer(self)
+        self._timer.setInterval(idle_interval_ms)
+        self._timer.timeout.connect(self._poll_once)
         
         # Import pygame lazily and suppress support prompt banner
         global pygame
@@ -140,68 +241,70 @@ class GamepadManager(QObject):
                 print(f"Gamepad detected: {self.joystick.get_name()}")
     
     def start(self):
-        """Start gamepad monitoring thread."""
+        """Start gamepad monitoring."""
         if not self.joystick:
             return
         
         self.running = True
-        self.thread = Thread(target=self._monitor_gamepad, daemon=True)
-        self.thread.start()
+        self._timer.start()
     
     def stop(self):
         """Stop gamepad monitoring."""
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=1.0)
+        self._timer.stop()
     
-    def _monitor_gamepad(self):
-        """Monitor gamepad input in separate thread."""
+    def _poll_once(self):
+        """Drain every queued pygame event (called by the Qt timer)."""
         if not pygame or not self.joystick:
             return
         
-        last_dpad = (0, 0)
-        button_states = [False] * self.joystick.get_numbuttons()
+        try:
+            # event.get() pumps SDL itself and returns the whole queue at once
+            events = pygame.event.get()
+            for event in events:
+                self._dispatch_event(event)
+        except Exception as e:
+            print(f"Gamepad error: {e}")
+            self.stop()
+            return
         
-        while self.running:
-            try:
-                pygame.event.pump()
-                
-                # Check D-pad
-                hat = self.joystick.get_hat(0) if self.joystick.get_numhats() > 0 else (0, 0)
-                if hat != last_dpad:
-                    if hat[0] == 1:  # Right
-                        self.dpad_moved.emit('right')
-                    elif hat[0] == -1:  # Left
-                        self.dpad_moved.emit('left')
-                    
-                    if hat[1] == 1:  # Up
-                        self.dpad_moved.emit('up')
-                    elif hat[1] == -1:  # Down
-                        self.dpad_moved.emit('down')
-                    
-                    last_dpad = hat
-                
-                # Check buttons
-                for i in range(self.joystick.get_numbuttons()):
-                    pressed = self.joystick.get_button(i)
-                    if pressed and not button_states[i]:
-                        self.button_pressed.emit(i)
-                    button_states[i] = pressed
-                
-                # Check analog sticks
-                if self.joystick.get_numaxes() >= 2:
-                    x_axis = self.joystick.get_axis(0)
-                    y_axis = self.joystick.get_axis(1)
-                    
-                    # Emit only significant movements
-                    if abs(x_axis) > 0.3 or abs(y_axis) > 0.3:
-                        self.analog_moved.emit(x_axis, y_axis)
-                
-                time.sleep(0.05)  # 20 FPS polling
-                
-            except Exception as e:
-                print(f"Gamepad error: {e}")
-                break
+        now = time.monotonic()
+        if events:
+            self._last_event_ts = now
+        if now - self._last_event_ts < self.ACTIVE_WINDOW:
+            interval = self._active_interval_ms
+        else:
+            interval = self._idle_interval_ms
+        if self._timer.interval() != interval:
+            self._timer.setInterval(interval)
+    
+    def _dispatch_event(self, event):
+        """Translate a pygame joystick event into the matching signal."""
+        if event.type == pygame.JOYBUTTONDOWN:
+            # SDL reports press edges, so no per-button state is needed
+            self.button_pressed.emit(event.button)
+        
+        elif event.type == pygame.JOYHATMOTION:
+            if event.hat != 0:
+                return
+            hat_x, hat_y = event.value
+            if hat_x == 1:  # Right
+                self.dpad_moved.emit('right')
+            elif hat_x == -1:  # Left
+                self.dpad_moved.emit('left')
+            
+            if hat_y == 1:  # Up
+                self.dpad_moved.emit('up')
+            elif hat_y == -1:  # Down
+                self.dpad_moved.emit('down')
+        
+        elif event.type == pygame.JOYAXISMOTION and event.axis in (0, 1) and self.joystick.get_numaxes() >= 2:
+            x_axis = self.joystick.get_axis(0)
+            y_axis = self.joystick.get_axis(1)
+            
+            # Emit only significant movements
+            if abs(x_axis) > 0.3 or abs(y_axis) > 0.3:
+                self.analog_moved.emit(x_axis, y_axis)
 
 
 class FocusableWidget(QWidget):
@@ -228,13 +331,7 @@ class FocusableWidget(QWidget):
     
     def update_style(self):
         """Update widget style based on focus state."""
-        if self._focused:
-            self.setStyleSheet("""
-                border: 3px solid #00ff00;
-                background-color: rgba(0, 255, 0, 30);
-            """)
-        else:
-            self.setStyleSheet("")
+        self.setStyleSheet(_FOCUS_CSS if self._focused else _UNFOCUS_CSS)
 
 
 class BigButton(FocusableWidget):
@@ -253,21 +350,11 @@ class BigButton(FocusableWidget):
         layout = QVBoxLayout()
         self.label = QLabel(text)
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        self.label.setFont(_font("Arial", 16, bold=True))
         layout.addWidget(self.label)
         self.setLayout(layout)
         
-        self.setStyleSheet("""
-            BigButton {
-                background-color: #2d3748;
-                border: 2px solid #4a5568;
-                border-radius: 10px;
-                color: white;
-            }
-            BigButton:hover {
-                background-color: #4a5568;
-            }
-        """)
+        self.setStyleSheet(_BIG_BUTTON_CSS)
     
     def keyPressEvent(self, event: QKeyEvent):
         """Handle key press events."""
@@ -294,12 +381,17 @@ class ROMListWidget(FocusableWidget):
         super().__init__(parent)
         self.roms = []
         self.current_index = 0
+        # One row widget per ROM, built once per result list
+        self._item_widgets = []
+        # Selection moves not yet applied (coalesced by move_selection)
+        self._pending_delta = 0
+        self._move_pending = False
         
         layout = QVBoxLayout()
         
         # Title
         self.title_label = QLabel("Search Results")
-        self.title_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.title_label.setFont(_font("Arial", 14, bold=True))
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.title_label)
         
@@ -322,24 +414,30 @@ class ROMListWidget(FocusableWidget):
         """Set the list of ROMs to display."""
         self.roms = roms
         self.current_index = 0
+        self._pending_delta = 0
         self.update_display()
     
     def update_display(self):
-        """Update the visual display of ROMs."""
-        # Clear existing items
-        for i in reversed(range(self.list_layout.count())):
-            self.list_layout.itemAt(i).widget().setParent(None)
+        """Rebuild the ROM rows; only needed when the result list changes."""
+        # Clear existing items; deleteLater frees the Qt side on the next
+        # event loop turn instead of leaving orphaned widgets behind
+        while (layout_item := self.list_layout.takeAt(0)) is not None:
+            widget = layout_item.widget()
+            if widget is not None:
+                widget.deleteLater()
+        self._item_widgets = []
         
         if not self.roms:
             no_results = QLabel("No ROMs found")
             no_results.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_results.setFont(QFont("Arial", 12))
+            no_results.setFont(_font("Arial", 12))
             self.list_layout.addWidget(no_results)
             return
         
         # Add ROM items
         for i, rom in enumerate(self.roms):
             item_widget = self.create_rom_item(rom, i == self.current_index)
+            self._item_widgets.append(item_widget)
             self.list_layout.addWidget(item_widget)
         
         # Update title
@@ -350,43 +448,27 @@ class ROMListWidget(FocusableWidget):
         item = QFrame()
         item.setFrameStyle(QFrame.Shape.Box)
         
-        if selected:
-            item.setStyleSheet("""
-                QFrame {
-                    background-color: #4a5568;
-                    border: 2px solid #00ff00;
-                    border-radius: 5px;
-                    padding: 10px;
-                }
-            """)
-        else:
-            item.setStyleSheet("""
-                QFrame {
-                    background-color: #2d3748;
-                    border: 1px solid #4a5568;
-                    border-radius: 5px;
-                    padding: 10px;
-                }
-            """)
+        item.setStyleSheet(_ROM_ITEM_SELECTED_CSS if selected else _ROM_ITEM_UNSELECTED_CSS)
         
         layout = QVBoxLayout()
         
         # Title
         title_label = QLabel(rom.title)
-        title_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        title_label.setStyleSheet("color: white;")
+        title_label.setFont(_font("Arial", 12, bold=True))
+        title_label.setStyleSheet(_ROM_TITLE_CSS)
         layout.addWidget(title_label)
         
         # Details
         details = f"Platform: {rom.platform} | Region: {rom.region}"
         if rom.year:
             details += f" | Year: {rom.year}"
-        if rom.size:
-            details += f" | Size: {format_file_size(rom.size)}"
+        size = rom.size  # property: resolves the best download link on each access
+        if size:
+            details += f" | Size: {format_file_size_cached(size)}"
         
         details_label = QLabel(details)
-        details_label.setFont(QFont("Arial", 10))
-        details_label.setStyleSheet("color: #a0aec0;")
+        details_label.setFont(_font("Arial", 10))
+        details_label.setStyleSheet(_ROM_DETAILS_CSS)
         layout.addWidget(details_label)
         
         item.setLayout(layout)
@@ -402,26 +484,51 @@ class ROMListWidget(FocusableWidget):
         elif event.key() == Qt.Key.Key_Down:
             self.move_selection(1)
         elif event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            if self._move_pending:
+                self._flush_move()  # act on the row the user navigated to
             if 0 <= self.current_index < len(self.roms):
                 self.rom_selected.emit(self.roms[self.current_index])
         elif event.key() == Qt.Key.Key_Space:
+            if self._move_pending:
+                self._flush_move()
             if 0 <= self.current_index < len(self.roms):
                 self.download_requested.emit(self.roms[self.current_index])
         else:
             super().keyPressEvent(event)
     
     def move_selection(self, direction: int):
-        """Move selection up or down."""
+        """Move selection up or down.
+
+        Moves arriving within 30 ms (e.g. a held D-pad) are summed and
+        applied together, with one restyle and one scroll.
+        """
         if not self.roms:
             return
         
-        self.current_index = max(0, min(len(self.roms) - 1, self.current_index + direction))
-        self.update_display()
+        self._pending_delta += direction
+        if not self._move_pending:
+            self._move_pending = True
+            QTimer.singleShot(30, self._flush_move)
+    
+    def _flush_move(self):
+        """Apply the accumulated selection movement."""
+        direction, self._pending_delta = self._pending_delta, 0
+        self._move_pending = False
+        if not self.roms or not direction:
+            return
+        
+        old_index = self.current_index
+        self.current_index = max(0, min(len(self.roms) - 1, old_index + direction))
+        if self.current_index == old_index:
+            return
+        
+        # Restyle only the two affected rows instead of rebuilding the list
+        self._item_widgets[old_index].setStyleSheet(_ROM_ITEM_UNSELECTED_CSS)
+        selected = self._item_widgets[self.current_index]
+        selected.setStyleSheet(_ROM_ITEM_SELECTED_CSS)
         
         # Scroll to current item if needed
-        item_height = 80  # Approximate item height
-        scroll_position = self.current_index * item_height
-        self.scroll_area.verticalScrollBar().setValue(scroll_position)
+        self.scroll_area.ensureWidgetVisible(selected)
 
 
 class DownloadProgressWidget(QWidget):
@@ -431,6 +538,15 @@ class DownloadProgressWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Latest progress not yet shown, flushed by the repaint timer
+        self._last_progress = None
+        # Formatted total size of the current ROM (constant during its download)
+        self._cached_total_size = -1
+        self._cached_total_str: Optional[str] = None
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setInterval(100)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.timeout.connect(self._apply_progress)
         self.setup_ui()
     
     def setup_ui(self):
@@ -439,32 +555,20 @@ class DownloadProgressWidget(QWidget):
         
         # Title
         self.title_label = QLabel("Download Progress")
-        self.title_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.title_label.setFont(_font("Arial", 14, bold=True))
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.title_label)
         
         # Current ROM
         self.current_rom_label = QLabel("")
-        self.current_rom_label.setFont(QFont("Arial", 12))
+        self.current_rom_label.setFont(_font("Arial", 12))
         self.current_rom_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.current_rom_label)
         
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setMinimumHeight(30)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #4a5568;
-                border-radius: 5px;
-                text-align: center;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: #00ff00;
-                border-radius: 3px;
-            }
-        """)
+        self.progress_bar.setStyleSheet(_PROGRESS_BAR_CSS)
         layout.addWidget(self.progress_bar)
         
         # Status info
@@ -482,7 +586,7 @@ class DownloadProgressWidget(QWidget):
         
         # Overall progress
         self.overall_label = QLabel("Overall Progress")
-        self.overall_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        self.overall_label.setFont(_font("Arial", 12, bold=True))
         layout.addWidget(self.overall_label)
         
         self.overall_progress = QProgressBar()
@@ -492,15 +596,35 @@ class DownloadProgressWidget(QWidget):
         self.setLayout(layout)
     
     def update_progress(self, progress: DownloadProgress):
-        """Update progress display."""
+        """Update progress display.
+
+        Repaints at most once per 100 ms: the first update shows at once,
+        later ones within the window only keep the latest value, which the
+        timer then applies.
+        """
+        self._last_progress = progress
+        if not self._repaint_timer.isActive():
+            self._apply_progress()
+    
+    def _apply_progress(self):
+        """Show the latest pending progress update, if any."""
+        progress, self._last_progress = self._last_progress, None
+        if progress is None:
+            return
+        # Every repaint opens a new 100 ms window, including the timer's own flush
+        self._repaint_timer.start()
+        
         if progress.total_size > 0:
-            percentage = int((progress.downloaded_size / progress.total_size) * 100)
+            percentage = int((progress.downloaded / progress.total_size) * 100)
             self.progress_bar.setValue(percentage)
             
-            size_text = f"{format_file_size(progress.downloaded_size)}/{format_file_size(progress.total_size)}"
+            if progress.total_size != self._cached_total_size:
+                self._cached_total_size = progress.total_size
+                self._cached_total_str = format_file_size(progress.total_size)
+            size_text = f"{format_file_size(progress.downloaded)}/{self._cached_total_str}"
             self.status_label.setText(f"{size_text} ({percentage}%)")
         else:
-            self.status_label.setText(f"{format_file_size(progress.downloaded_size)}")
+            self.status_label.setText(f"{format_file_size(progress.downloaded)}")
         
         if progress.speed:
             self.speed_label.setText(f"Speed: {format_file_size(progress.speed)}/s")
@@ -510,11 +634,18 @@ class DownloadProgressWidget(QWidget):
     
     def set_current_rom(self, rom_title: str, index: int, total: int):
         """Set current ROM being downloaded."""
+        # Show the previous ROM's pending update before the header moves on
+        self._apply_progress()
+        self._cached_total_size = -1
+        self._cached_total_str = None
         self.current_rom_label.setText(f"[{index}/{total}] {rom_title}")
         self.overall_progress.setValue(int((index / total) * 100))
     
     def set_completed(self, successful: int, total: int):
         """Set download completion status."""
+        # Flush a pending update so it cannot land after the final state
+        self._apply_progress()
+        self._repaint_timer.stop()
         self.title_label.setText("Download Completed")
         self.current_rom_label.setText(f"Completed: {successful}/{total} successful")
         self.progress_bar.setValue(100)
@@ -537,7 +668,7 @@ class SearchScreen(QWidget):
         
         # Title
         title = QLabel("ROM Search")
-        title.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        title.setFont(_font("Arial", 18, bold=True))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
@@ -548,25 +679,36 @@ class SearchScreen(QWidget):
         form_layout.addWidget(QLabel("Game Title:"), 0, 0)
         self.query_input = QLineEdit()
         self.query_input.setMinimumHeight(40)
-        self.query_input.setFont(QFont("Arial", 12))
+        self.query_input.setFont(_font("Arial", 12))
         form_layout.addWidget(self.query_input, 0, 1)
         
         # Platform input
         form_layout.addWidget(QLabel("Platform:"), 1, 0)
         self.platform_input = QLineEdit()
         self.platform_input.setMinimumHeight(40)
-        self.platform_input.setFont(QFont("Arial", 12))
+        self.platform_input.setFont(_font("Arial", 12))
         form_layout.addWidget(self.platform_input, 1, 1)
         
         # Region input
         form_layout.addWidget(QLabel("Region:"), 2, 0)
         self.region_input = QLineEdit()
         self.region_input.setMinimumHeight(40)
-        self.region_input.setFont(QFont("Arial", 12))
+        self.region_input.setFont(_font("Arial", 12))
         form_layout.addWidget(self.region_input, 2, 1)
         
         layout.addLayout(form_layout)
         
+        # Search as the user types, once input pauses for 300 ms
+        # (each keystroke restarts the timer, so only the last one queries)
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(300)
+        self._search_debounce.timeout.connect(self.perform_search)
+        # Bumped per search so results from a superseded, slower request are dropped
+        self._search_request_id = 0
+        for line_edit in (self.query_input, self.platform_input, self.region_input):
+            line_edit.textChanged.connect(lambda _text: self._search_debounce.start())
+        
         # Buttons
         button_layout = QHBoxLayout()
         
@@ -614,6 +756,8 @@ class SearchScreen(QWidget):
     
     def perform_search(self):
         """Perform ROM search."""
+        # An explicit search supersedes one still waiting on the debounce
+        self._search_debounce.stop()
         query = self.query_input.text().strip()
         if not query:
             return
@@ -627,7 +771,8 @@ class SearchScreen(QWidget):
         )
         
         # Perform search in background thread
-        self.gui_app.perform_search_async(query, search_filter, self.on_search_complete)
+        self._search_request_id += 1
+        self.gui_app.perform_search_async(query, search_filter, self.on_search_complete, self._search_request_id)
     
     def get_random_roms(self):
         """Get random ROMs."""
@@ -640,10 +785,14 @@ class SearchScreen(QWidget):
         )
         
         # Get random ROMs in background thread
-        self.gui_app.get_random_roms_async(search_filter, self.on_search_complete)
+        self._search_request_id += 1
+        self.gui_app.get_random_roms_async(search_filter, self.on_search_complete, self._search_request_id)
     
-    def on_search_complete(self, roms: List[ROMEntry]):
-        """Handle search completion."""
+    @pyqtSlot(list, int)
+    def on_search_complete(self, roms: List[ROMEntry], request_id: int):
+        """Handle search completion, ignoring results of superseded requests."""
+        if request_id != self._search_request_id:
+            return
         self.rom_list.set_roms(roms)
     
     def clear_search(self):
@@ -651,6 +800,7 @@ class SearchScreen(QWidget):
         self.query_input.clear()
         self.platform_input.clear()
         self.region_input.clear()
+        self._search_request_id += 1
         self.rom_list.set_roms([])
     
     def show_rom_info(self, rom: ROMEntry):
@@ -702,7 +852,7 @@ class DownloadScreen(QWidget):
         # Log area
         self.log_area = QTextEdit()
         self.log_area.setReadOnly(True)
-        self.log_area.setFont(QFont("Consolas", 10))
+        self.log_area.setFont(_font("Consolas", 10))
         self.log_area.setMaximumHeight(200)
         layout.addWidget(self.log_area)
         
@@ -729,11 +879,17 @@ class DownloadScreen(QWidget):
         """Start downloading ROMs."""
         self.gui_app.start_download_process(self.roms_to_download, self.on_progress, self.on_complete)
     
+    @pyqtSlot(object, str, int, int)
     def on_progress(self, progress: DownloadProgress, rom_title: str, index: int, total: int):
         """Handle download progress updates."""
+        # The header only changes when the next ROM starts; every other update
+        # goes through the widget's repaint throttle
+        if index != self.current_index:
+            self.current_index = index
+            self.progress_widget.set_current_rom(rom_title, index, total)
         self.progress_widget.update_progress(progress)
-        self.progress_widget.set_current_rom(rom_title, index, total)
     
+    @pyqtSlot(int, int, list)
     def on_complete(self, successful: int, total: int, log_messages: List[str]):
         """Handle download completion."""
         self.progress_widget.set_completed(successful, total)
@@ -775,7 +931,7 @@ class ConfigScreen(QWidget):
         
         # Title
         title = QLabel("Configuration")
-        title.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        title.setFont(_font("Arial", 18, bold=True))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
@@ -1037,7 +1193,8 @@ class GUIInterface:
         api_config = self.config.get('api', {}) or {}
         self.api_client = CrocDBClient(
             base_url=api_config.get('base_url', 'https://api.crocdb.net'),
-            timeout=api_config.get('timeout', 30)
+            timeout=api_config.get('timeout', 30),
+            cache=CacheManager.from_config(self.dirs, self.config, namespace="api")
         )
         
         # Initialize search engine
@@ -1063,6 +1220,11 @@ class GUIInterface:
         self.download_thread = None
         self.download_cancelled = False
         
+        # asyncio loop running on the Qt event loop (set by run_interface with qasync)
+        self._loop = None
+        # Strong references to running download tasks (the loop only keeps weak ones)
+        self._download_tasks = set()
+        
         # Main window will be created in run_interface
         self.main_window = None
     
@@ -1073,12 +1235,12 @@ class GUIInterface:
         
         # Title
         title = QLabel(f"{t('app.name')}")
-        title.setFont(QFont("Arial", 24, QFont.Weight.Bold))
+        title.setFont(_font("Arial", 24, bold=True))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
         subtitle = QLabel("Gamepad-Navigable ROM Downloader")
-        subtitle.setFont(QFont("Arial", 14))
+        subtitle.setFont(_font("Arial", 14))
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(subtitle)
         
@@ -1161,28 +1323,32 @@ D-Pad - Navigate
         
         QMessageBox.about(self.main_window, "About", about_text)
     
-    def perform_search_async(self, query: str, search_filter: SearchFilter, callback: Callable):
-        """Perform search in background thread."""
+    def perform_search_async(self, query: str, search_filter: SearchFilter, callback: Callable, request_id: int = 0):
+        """Perform search in background thread.
+
+        request_id is passed back to the callback so the caller can tell
+        which of several overlapping searches a result belongs to.
+        """
         def search_worker():
             try:
                 # Use synchronous search instead of asyncio
                 results = self.search_engine.search_sync(query, search_filter, 50)
-                QTimer.singleShot(0, lambda: callback([rom.rom_entry for rom in results]))
+                _call_in_gui_thread(callback, (list, [rom.rom_entry for rom in results]), (int, request_id))
             except Exception as e:
-                QTimer.singleShot(0, lambda: callback([]))
+                _call_in_gui_thread(callback, (list, []), (int, request_id))
         
         thread = Thread(target=search_worker, daemon=True)
         thread.start()
     
-    def get_random_roms_async(self, search_filter: SearchFilter, callback: Callable):
-        """Get random ROMs in background thread."""
+    def get_random_roms_async(self, search_filter: SearchFilter, callback: Callable, request_id: int = 0):
+        """Get random ROMs in background thread (request_id as in perform_search_async)."""
         def random_worker():
             try:
                 # Use synchronous random search
                 results = self.search_engine.get_random_roms_sync(10, search_filter)
-                QTimer.singleShot(0, lambda: callback(results))
+                _call_in_gui_thread(callback, (list, results), (int, request_id))
             except Exception as e:
-                QTimer.singleShot(0, lambda: callback([]))
+                _call_in_gui_thread(callback, (list, []), (int, request_id))
         
         thread = Thread(target=random_worker, daemon=True)
         thread.start()
@@ -1215,39 +1381,65 @@ Region: {region_str}
         self.main_window.central_widget.setCurrentWidget(download_screen)
     
     def start_download_process(self, roms: List[ROMEntry], progress_callback: Callable, complete_callback: Callable):
-        """Start download process in background thread."""
+        """Start download process.
+
+        With qasync the downloads run as a task on the Qt event loop and the
+        callbacks are plain calls; otherwise they run in a background thread
+        with its own asyncio loop and the callbacks are queued to the GUI thread.
+        """
         self.download_cancelled = False
         
+        if self._loop is not None:
+            task = self._loop.create_task(self._download_roms(roms, progress_callback, complete_callback))
+            self._download_tasks.add(task)
+            task.add_done_callback(self._download_tasks.discard)
+            return
+        
         def download_worker():
-            successful = 0
-            log_messages = []
-            
-            for i, rom in enumerate(roms):
-                if self.download_cancelled:
-                    break
-                
-                log_messages.append(f"Starting download: {rom.title}")
-                
+            async def run():
                 try:
-                    def progress_handler(progress: DownloadProgress):
-                        QTimer.singleShot(0, lambda: progress_callback(progress, rom.title, i + 1, len(roms)))
-                    
-                    result = self.download_manager.download_rom(rom, progress_callback=progress_handler)
-                    
-                    if result.success:
-                        log_messages.append(f"✓ Downloaded: {rom.title}")
-                        successful += 1
-                    else:
-                        log_messages.append(f"✗ Failed: {rom.title} - {result.error}")
-                
-                except Exception as e:
-                    log_messages.append(f"✗ Error: {rom.title} - {e}")
+                    await self._download_roms(
+                        roms,
+                        lambda *args: _call_in_gui_thread(progress_callback, *zip((object, str, int, int), args)),
+                        lambda *args: _call_in_gui_thread(complete_callback, *zip((int, int, list), args)),
+                    )
+                finally:
+                    # The HTTP client is bound to this thread's loop, which ends here
+                    await self.download_manager.aclose()
             
-            QTimer.singleShot(0, lambda: complete_callback(successful, len(roms), log_messages))
+            asyncio.run(run())
         
         self.download_thread = Thread(target=download_worker, daemon=True)
         self.download_thread.start()
     
+    async def _download_roms(self, roms: List[ROMEntry], progress_callback: Callable, complete_callback: Callable):
+        """Download ROMs one after another, reporting progress and the final summary."""
+        successful = 0
+        log_messages = []
+        
+        for i, rom in enumerate(roms, start=1):
+            if self.download_cancelled:
+                break
+            
+            log_messages.append(f"Starting download: {rom.title}")
+            
+            try:
+                def progress_handler(progress: DownloadProgress, title=rom.title, index=i):
+                    progress_callback(progress, title, index, len(roms))
+                
+                result = await self.download_manager.download_rom(rom, progress_callback=progress_handler)
+                
+                if result.success:
+                    log_messages.append(f"✓ Downloaded: {rom.title}")
+                    successful += 1
+                else:
+                    log_messages.append(f"✗ Failed: {rom.title} - {result.error}")
+            
+            except Exception as e:
+                log_messages.append(f"✗ Error: {rom.title} - {e}")
+        
+        complete_callback(successful, len(roms), log_messages)
+    
     def cancel_download(self):
         """Cancel ongoing download."""
         self.download_cancelled = True
@@ -1295,8 +1487,16 @@ Region: {region_str}
         self.gamepad.stop()
         if hasattr(self, 'download_cancelled'):
             self.download_cancelled = True
+        for task in self._download_tasks:
+            task.cancel()
         event.accept()
     
+    async def _shutdown_downloads(self):
+        """Wait for cancelled download tasks to unwind, then close the HTTP client."""
+        if self._download_tasks:
+            await asyncio.gather(*self._download_tasks, return_exceptions=True)
+        await self.download_manager.aclose()
+    
     def run_interface(self) -> int:
         """
         Run the GUI interface.
@@ -1316,6 +1516,17 @@ Region: {region_str}
             self.main_window.closeEvent = self.closeEvent
             
             self.main_window.show()
+            
+            if qasync is not None:
+                # Run asyncio on the Qt event loop: coroutines (downloads) are
+                # awaited on the GUI thread instead of bridged through threads
+                self._loop = qasync.QEventLoop(app)
+                asyncio.set_event_loop(self._loop)
+                with self._loop:
+                    exit_code = self._loop.run_forever() or 0
+                    # Finish download cleanup while the loop can still run it
+                    self._loop.run_until_complete(self._shutdown_downloads())
+                    return exit_code
             return app.exec()
         except Exception as e:
             import traceback
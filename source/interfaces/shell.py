@@ -30,11 +30,11 @@ except ImportError:
     sys.exit(1)
 
 from loguru import logger
-from ..core import DirectoryManager, ConfigManager, LogManager, SearchEngine, SearchFilter
+from ..core import DirectoryManager, ConfigManager, LogManager, SearchEngine, SearchFilter, CacheManager
 from ..core.crocdb_client import CrocDBClient
 from ..core import DownloadManager
 from ..locales import get_i18n, t
-from ..core.helpers import format_file_size, sanitize_filename
+from ..core.helpers import format_file_size, format_file_size_cached, sanitize_filename
 from .cli import CLIInterface
 
 
@@ -68,7 +68,8 @@ class ShellInterface:
         self.api_client = CrocDBClient(
             base_url=api_config.get('base_url'),
             timeout=api_config.get('timeout', 30),
-            max_retries=api_config.get('max_retries', 3)
+            max_retries=api_config.get('max_retries', 3),
+            cache=CacheManager.from_config(self.dirs, self.config, namespace="api")
         )
         
         # Initialize search engine
@@ -502,12 +503,7 @@ class ShellInterface:
                     for i, rom in enumerate(selected_roms, 1):
                         print(f"\n[{i}/{total_downloads}] {t('download.starting')}: {getattr(rom, 'title', '')}")
                         try:
-                            result = asyncio.run(
-                                self.download_manager.download_rom(
-                                    rom,
-                                    download_boxart=True
-                                )
-                            )
+                            result = asyncio.run(self._download_one(rom))
 
                             if result.success:
                                 print(f"\n{t('download.completed')}: {result.final_path}")
@@ -1029,7 +1025,7 @@ class ShellInterface:
 
                 # Size
                 size_val = getattr(rom, 'size', 0) or 0
-                size_disp = format_file_size(size_val).rjust(w_size)
+                size_disp = format_file_size_cached(size_val).rjust(w_size)
 
                 if show_scores:
                     score_str = f"{(score if score is not None else 0):>6.3f}"
@@ -1099,6 +1095,21 @@ class ShellInterface:
             else:
                 print(f"{full_key}: {value}")
     
+    async def _download_one(self, rom):
+        """
+        Download a single ROM inside its own asyncio.run() loop.
+
+        The download manager's HTTP client is bound to this short-lived loop,
+        so it is closed here before the loop goes away.
+
+        Args:
+            rom: ROM entry to download
+        """
+        try:
+            return await self.download_manager.download_rom(rom, download_boxart=True)
+        finally:
+            await self.download_manager.aclose()
+
     def _download_progress_callback(self, progress) -> None:
         """
         Handle download progress updates.
@@ -84,7 +84,7 @@ except ImportError:
     Message = DummyTextualBase
     def reactive(x): return x
 
-from ..core import DirectoryManager, ConfigManager, LogManager, SearchEngine, SearchFilter
+from ..core import DirectoryManager, ConfigManager, LogManager, SearchEngine, SearchFilter, CacheManager
 from ..core.crocdb_client import CrocDBClient, ROMEntry
 from ..core import DownloadManager, DownloadProgress
 from ..locales import get_i18n, t
@@ -885,7 +885,8 @@ class TUIInterface(App):
         self.api_client = CrocDBClient(
             base_url=api_config.get('base_url'),
             timeout=api_config.get('timeout', 30),
-            max_retries=api_config.get('max_retries', 3)
+            max_retries=api_config.get('max_retries', 3),
+            cache=CacheManager.from_config(self.dirs, self.config, namespace="api")
         )
         
         # Initialize search engine
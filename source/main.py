@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+# PYTHON_ARGCOMPLETE_OK
 """
 CLI Download ROM - Main Entry Point
 
@@ -34,8 +35,7 @@ from source.locales import init_i18n, t
 from source.core.version import __version__, get_version_string
 from source.interfaces import (
     CLIInterface, 
-    ShellInterface,
-    get_available_interfaces,
+    get_interface_names,
     create_interface,
     is_tui_available,
     is_gui_available
@@ -82,7 +82,8 @@ def setup_argument_parser() -> argparse.ArgumentParser:
     )
     
     # Interface selection
-    available_interfaces = list(get_available_interfaces().keys())
+    # Names only: avoids importing Shell/TUI/GUI modules just to list choices
+    available_interfaces = get_interface_names()
     parser.add_argument(
         "--interface", "-i",
         choices=available_interfaces,
@@ -182,6 +183,11 @@ def setup_argument_parser() -> argparse.ArgumentParser:
         default="table",
         help="Output format (default: table)"
     )
+    search_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk search cache and query the API"
+    )
     search_parser.add_argument(
         "--download",
         action="store_true",
@@ -364,7 +370,7 @@ def initialize_application(args) -> tuple:
     directory_manager.ensure_directories()
     
     # Initialize configuration manager
-    config_manager = ConfigManager(args.config)
+    config_manager = ConfigManager(args.config, cache_dir=directory_manager.get_path('cache'))
     
     # Override language if specified
     if args.language:
@@ -420,12 +426,21 @@ def main():
     try:
         # Parse command line arguments
         parser = setup_argument_parser()
+
+        # Shell completion (argcomplete): answer and exit before any app initialization
+        if os.environ.get('_ARGCOMPLETE'):
+            try:
+                import argcomplete
+            except ImportError:
+                sys.exit(1)
+            argcomplete.autocomplete(parser)
+
         args, unknown = parser.parse_known_args()
 
         # If executed without any arguments, start Shell interface automatically
         if len(sys.argv) == 1:
             config_manager, directory_manager, log_manager = initialize_application(args)
-            interface = ShellInterface(config_manager, directory_manager, log_manager)
+            interface = create_interface('shell', config_manager, directory_manager, log_manager)
             interface.run()
             return
 
@@ -497,6 +512,8 @@ def main():
                             cli_args.extend(['--limit', str(args.limit)])
                         if hasattr(args, 'format') and args.format:
                             cli_args.extend(['--format', args.format])
+                        if hasattr(args, 'no_cache') and args.no_cache:
+                            cli_args.append('--no-cache')
                     
                     elif args.command == 'download':
                         # CLIInterface expects: download <target> [--output DIR]
@@ -555,7 +572,7 @@ def main():
         
         elif args.interface == "shell":
             # Shell mode - interactive REPL
-            interface = ShellInterface(config_manager, directory_manager, log_manager)
+            interface = create_interface('shell', config_manager, directory_manager, log_manager)
             interface.run()
         
         else: